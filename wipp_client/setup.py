@@ -31,9 +31,27 @@ requirements = [
     "pydantic>=1.8.2",
 ]
 
+test_requirements = [
+    "black>=19.10b0",
+    "flake8>=3.8.3",
+    "pytest>=5.4.3",
+    "pytest-cov>=2.9.0",
+]
+
+http2_requirements = [
+    "httpx[http2]>=0.18",
+]
+
+numpy_requirements = [
+    "numpy>=1.17",
+]
+
 extra_requirements = {
     "setup": setup_requirements,
+    "test": test_requirements,
     "dev": dev_requirements,
+    "http2": http2_requirements,
+    "numpy": numpy_requirements,
     "all": [
         *requirements,
         *dev_requirements,
@@ -53,6 +71,11 @@ setup(
         "Programming Language :: Python :: 3.9",
     ],
     description="WIPP API Python client",
+    entry_points={
+        "console_scripts": [
+            "wipp=wipp_client.cli:main",
+        ],
+    },
     install_requires=requirements,
     license="MIT license",
     long_description=readme,
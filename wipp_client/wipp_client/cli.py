@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Command line interface for WIPP API
+
+Installed as the `wipp` console script, run `wipp --help` for the list of commands.
+The WIPP API URL is read from WIPP_API_INTERNAL_URL, as in the Wipp client, and
+the Keycloak token from --token or WIPP_KEYCLOAK_TOKEN.
+"""
+
+# Standard library
+import os
+import sys
+import json
+import argparse
+import logging
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+# Relative
+from .wipp import Wipp, WippEntity, _bounded_map, _entity_classes
+
+###############################################################################
+
+log = logging.getLogger(__name__)
+
+
+def _print_entity(entity: WippEntity, args: argparse.Namespace):
+    if args.json:
+        print(entity.json(by_alias=True), flush=True)
+    else:
+        print(entity, flush=True)
+
+
+def _print_result(result: dict, args: argparse.Namespace):
+    if args.json:
+        print(json.dumps(result), flush=True)
+    else:
+        print("\t".join(str(value) for value in result.values()), flush=True)
+
+
+def _read_lines(path: str, numbered: bool = False):
+    """Lazily read non-empty lines of a file (or stdin for "-"), as (line number,
+    line) pairs if numbered"""
+    f = sys.stdin if path == "-" else open(path)
+    try:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if line:
+                yield (number, line) if numbered else line
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _extra_query(args: argparse.Namespace) -> dict:
+    return {"size": args.page_size} if args.page_size else {}
+
+
+###############################################################################
+# Commands
+
+
+def list_entities(w: Wipp, args: argparse.Namespace):
+    for entity in w.iter_entities(
+        args.plural,
+        path_prefix=args.path_prefix,
+        extra_query=_extra_query(args),
+        prefetch=args.workers,
+    ):
+        _print_entity(entity, args)
+
+
+def search_entities(w: Wipp, args: argparse.Namespace):
+    for entity in w.iter_entities(
+        args.plural,
+        path_suffix="search/findByNameContainingIgnoreCase",
+        extra_query={"name": args.name, **_extra_query(args)},
+        prefetch=args.workers,
+    ):
+        _print_entity(entity, args)
+
+
+def create_entities(w: Wipp, args: argparse.Namespace):
+    entity_class = _entity_classes.get(args.plural, WippEntity)
+
+    def create(numbered_line):
+        number, line = numbered_line
+        try:
+            data = json.loads(line)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            entity = w.create_entity(args.plural, entity_class(**data))
+        except Exception as e:
+            return {"line": number, "error": str(e).replace("\n", " ")}
+        if entity is None:
+            return {"line": number, "error": "request failed"}
+        return entity
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for result in _bounded_map(
+            executor, create, _read_lines(args.file, numbered=True), 2 * args.workers
+        ):
+            if isinstance(result, dict):
+                failed = True
+                _print_result(result, args)
+            else:
+                _print_entity(result, args)
+    if failed:
+        sys.exit(1)
+
+
+def delete_entities(w: Wipp, args: argparse.Namespace):
+    ids = args.ids or _read_lines("-")
+
+    def delete(entity_id):
+        return {"id": entity_id, "deleted": w.delete_entity(args.plural, entity_id)}
+
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for result in _bounded_map(executor, delete, ids, 2 * args.workers):
+            _print_result(result, args)
+
+
+def purge_entities(w: Wipp, args: argparse.Namespace):
+    older_than = None if args.older_than is None else timedelta(days=args.older_than)
+    failed = False
+    for result in w.iter_purge(
+        args.plural,
+        name_pattern=args.name,
+        older_than=older_than,
+        dry_run=args.dry_run,
+        workers=args.workers,
+    ):
+        failed = failed or result.deleted is False
+        if args.json:
+            print(result.json(), flush=True)
+        else:
+            print(result, flush=True)
+    if failed:
+        sys.exit(1)
+
+
+def register_plugins(w: Wipp, args: argparse.Namespace):
+    failed = False
+    for result in w.iter_register_plugins(
+        args.directory,
+        pattern=args.pattern,
+        recursive=args.recursive,
+        dry_run=args.dry_run,
+        workers=args.workers,
+    ):
+        failed = failed or result.status in ("invalid", "failed")
+        if args.json:
+            print(result.json(), flush=True)
+        else:
+            print(result, flush=True)
+    if failed:
+        sys.exit(1)
+
+
+def upload_images(w: Wipp, args: argparse.Namespace):
+    def upload(path):
+        return {"file": path, "uploaded": w.upload_image(args.collection_id, path)}
+
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for result in _bounded_map(executor, upload, args.files, 2 * args.workers):
+            _print_result(result, args)
+
+
+def download_images(w: Wipp, args: argparse.Namespace):
+    os.makedirs(args.directory, exist_ok=True)
+
+    def download(image):
+        path = w.download_image(args.collection_id, image, args.directory)
+        return {"file": image.file_name, "path": path}
+
+    images = w.iter_entities(
+        "images",
+        path_prefix="imagesCollections/" + args.collection_id,
+        extra_query=_extra_query(args),
+    )
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for result in _bounded_map(executor, download, images, 2 * args.workers):
+            _print_result(result, args)
+
+
+def sync_images(w: Wipp, args: argparse.Namespace):
+    plan = w.sync_image_collection(
+        args.collection_id,
+        args.directory,
+        pattern=args.pattern,
+        delete_extra=args.delete,
+        dry_run=args.dry_run,
+        workers=args.workers,
+    )
+    if args.json:
+        print(plan.json(), flush=True)
+    else:
+        print(plan, flush=True)
+    if plan.errors:
+        sys.exit(1)
+
+
+###############################################################################
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="wipp", description="WIPP API client")
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("WIPP_KEYCLOAK_TOKEN"),
+        help="Keycloak token (default: WIPP_KEYCLOAK_TOKEN environment variable)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="number of concurrent requests"
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=None, help="number of entities per page"
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, default=None, help="maximum requests per second"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print results as JSON Lines"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log requests")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("list", help="list entities")
+    command.add_argument("plural", help='entity plural (such as "imagesCollections")')
+    command.add_argument(
+        "--path-prefix",
+        default="",
+        help='path of the parent entity (such as "imagesCollections/<id>")',
+    )
+    command.set_defaults(func=list_entities)
+
+    command = commands.add_parser("search", help="search entities by name")
+    command.add_argument("plural", help='entity plural (such as "plugins")')
+    command.add_argument("name", help="string to search in entity names")
+    command.set_defaults(func=search_entities)
+
+    command = commands.add_parser(
+        "create", help="create entities from a JSON Lines file"
+    )
+    command.add_argument("plural", help='entity plural (such as "plugins")')
+    command.add_argument(
+        "file", help='JSON Lines file with one entity per line, "-" for stdin'
+    )
+    command.set_defaults(func=create_entities)
+
+    command = commands.add_parser("delete", help="delete entities by id")
+    command.add_argument("plural", help='entity plural (such as "csvCollections")')
+    command.add_argument("ids", nargs="*", help="entity ids (read from stdin if none)")
+    command.set_defaults(func=delete_entities)
+
+    command = commands.add_parser(
+        "purge", help="delete entities matching a name pattern and/or age"
+    )
+    command.add_argument("plural", help='entity plural (such as "imagesCollections")')
+    command.add_argument("--name", help='glob pattern of names (such as "test-*")')
+    command.add_argument(
+        "--older-than",
+        type=float,
+        metavar="DAYS",
+        help="only entities created more than DAYS ago",
+    )
+    command.add_argument(
+        "--dry-run", action="store_true", help="only print the matching entities"
+    )
+    command.set_defaults(func=purge_entities)
+
+    command = commands.add_parser(
+        "register", help="register new plugins from a directory of manifests"
+    )
+    command.add_argument("directory", help="directory with plugin manifests")
+    command.add_argument(
+        "--pattern", default="*.json", help="glob pattern of manifest files"
+    )
+    command.add_argument(
+        "--recursive", action="store_true", help="also search subdirectories"
+    )
+    command.add_argument(
+        "--dry-run", action="store_true", help="only print which plugins are new"
+    )
+    command.set_defaults(func=register_plugins)
+
+    command = commands.add_parser("upload", help="upload images to a collection")
+    command.add_argument("collection_id", help="WIPP Image Collection id")
+    command.add_argument("files", nargs="+", help="image files to upload")
+    command.set_defaults(func=upload_images)
+
+    command = commands.add_parser("download", help="download images of a collection")
+    command.add_argument("collection_id", help="WIPP Image Collection id")
+    command.add_argument("directory", help="directory to download the images to")
+    command.set_defaults(func=download_images)
+
+    command = commands.add_parser(
+        "sync", help="mirror a local directory into an image collection"
+    )
+    command.add_argument("collection_id", help="WIPP Image Collection id")
+    command.add_argument("directory", help="local directory with the images")
+    command.add_argument("--pattern", default="*", help="glob pattern of local files")
+    command.add_argument(
+        "--delete", action="store_true", help="delete images missing locally"
+    )
+    command.add_argument(
+        "--dry-run", action="store_true", help="only print the sync plan"
+    )
+    command.set_defaults(func=sync_images)
+
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    w = Wipp(requests_per_second=args.rate_limit, max_in_flight=args.workers)
+    if args.token:
+        w.auth_headers = args.token
+
+    try:
+        args.func(w, args)
+    except BrokenPipeError:
+        # Output piped into a command which stopped reading (such as head)
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
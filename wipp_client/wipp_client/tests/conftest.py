@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Local stub of WIPP API for the client tests
+
+The stub keeps entities in `store`, keyed by their collection path (such as
+"plugins" or "imagesCollections/<id>/images"), and serves them with the
+Spring Data REST paging of WIPP. Requests can be intercepted with `routes`,
+a dict of (method, path) -> handler(request, query, body) returning
+(status, body, headers) or None to fall through.
+"""
+
+# Standard library
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Third party
+import pytest
+
+###############################################################################
+
+# Embedded keys which differ from the plural (see Wipp.get_entities_page)
+EMBEDDED_KEYS = {"csv": "csvs", "genericFile": "genericFiles"}
+
+
+class WippStub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.store = {}
+        self.routes = {}
+        self.page_size = 20
+        # Seconds to sleep before answering GET requests
+        self.delay = 0.0
+        # (method, path, headers) of every request received
+        self.log = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/api"
+
+    def requests(self, method: str = None, path: str = None) -> list:
+        with self.lock:
+            return [
+                entry
+                for entry in self.log
+                if (method is None or entry[0] == method)
+                and (path is None or entry[1] == path)
+            ]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body together, avoiding delayed ACK stalls
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body=None, headers: dict = None):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode()
+        elif isinstance(body, str):
+            body = body.encode()
+        body = body or b""
+        self.send_response(status)
+        headers = headers or {}
+        headers.setdefault("Content-Type", "application/json")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str):
+        url = urlparse(self.path)
+        path = url.path[len("/api") :].strip("/")
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        stub = self.server
+        with stub.lock:
+            stub.log.append((method, path, dict(self.headers)))
+
+        route = stub.routes.get((method, path))
+        if route is not None:
+            response = route(self, query, body)
+            if response is not None:
+                return self._reply(*response)
+
+        if method == "GET" and stub.delay:
+            time.sleep(stub.delay)
+        parts = path.split("/") if path else []
+        if method == "GET":
+            if not parts:
+                return self._reply(200, {"_links": {}})
+            if "search" in parts:
+                key = "/".join(parts[: parts.index("search")])
+                name = query.get("name", "").lower()
+                items = [
+                    i for i in stub.store.get(key, []) if name in i["name"].lower()
+                ]
+                return self._page(parts[parts.index("search") - 1], items, query)
+            if len(parts) % 2:
+                return self._page(parts[-1], stub.store.get(path, []), query)
+            for item in stub.store.get("/".join(parts[:-1]), []):
+                if item["id"] == parts[-1]:
+                    return self._reply(200, item)
+            return self._reply(404, {"error": "Not Found"})
+        if method == "POST":
+            item = {**json.loads(body), "id": f"id{len(stub.log)}"}
+            stub.store.setdefault(path, []).append(item)
+            return self._reply(201, item)
+        if method == "DELETE":
+            key = "/".join(parts[:-1])
+            items = stub.store.get(key, [])
+            remaining = [i for i in items if i["id"] != parts[-1]]
+            if len(remaining) == len(items):
+                return self._reply(404, {"error": "Not Found"})
+            stub.store[key] = remaining
+            return self._reply(204)
+        self._reply(405)
+
+    def _page(self, plural: str, items: list, query: dict):
+        size = int(query.get("size", self.server.page_size))
+        page = int(query.get("page", 0))
+        self._reply(
+            200,
+            {
+                "_embedded": {
+                    EMBEDDED_KEYS.get(plural, plural): items[
+                        page * size : (page + 1) * size
+                    ]
+                },
+                "page": {
+                    "size": size,
+                    "totalElements": len(items),
+                    "totalPages": (len(items) + size - 1) // size,
+                    "number": page,
+                },
+            },
+        )
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+@pytest.fixture
+def wipp_stub(monkeypatch):
+    stub = WippStub()
+    thread = threading.Thread(target=stub.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    monkeypatch.setenv("WIPP_API_INTERNAL_URL", stub.url)
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+def plugin(i: int, **fields) -> dict:
+    """WIPP JSON of a valid plugin"""
+    return {
+        "id": f"p{i}",
+        "name": f"plugin{i}",
+        "version": "1.0",
+        "containerId": "wipp/noop",
+        "title": "Noop",
+        "description": "Does nothing",
+        "inputs": [],
+        "outputs": [],
+        "ui": [],
+        **fields,
+    }
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+import json
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp, WippImage, cli
+from .conftest import plugin
+
+###############################################################################
+
+
+def test_list_prints_json_lines(wipp_stub, capsys):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(25)]
+    cli.main(["--json", "--workers", "2", "list", "plugins"])
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [f"p{i}" for i in range(25)]
+
+
+def test_search(wipp_stub, capsys):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(25)]
+    cli.main(["--json", "search", "plugins", "plugin2"])
+    names = [json.loads(line)["name"] for line in capsys.readouterr().out.splitlines()]
+    assert names == ["plugin2"] + [f"plugin{i}" for i in range(20, 25)]
+
+
+def test_create_from_json_lines(wipp_stub, tmp_path, capsys):
+    path = tmp_path / "plugins.jsonl"
+    path.write_text("\n".join(json.dumps(plugin(i)) for i in range(3)) + "\n")
+    cli.main(["create", "plugins", str(path)])
+    assert len(wipp_stub.store["plugins"]) == 3
+    assert len(capsys.readouterr().out.splitlines()) == 3
+
+
+def test_create_reports_invalid_lines(wipp_stub, tmp_path, capsys):
+    path = tmp_path / "plugins.jsonl"
+    lines = [json.dumps(plugin(0)), "{not json", "", json.dumps({"name": "x"})]
+    path.write_text("\n".join(lines + [json.dumps(plugin(1))]) + "\n")
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(["--json", "create", "plugins", str(path)])
+    assert excinfo.value.code == 1
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["line"] for r in results if "error" in r] == [2, 4]
+    assert len(wipp_stub.store["plugins"]) == 2
+
+
+def image(file_name: str) -> dict:
+    return {"id": "i1", "fileName": file_name, "fileSize": 4}
+
+
+def test_download_stays_in_directory(wipp_stub, tmp_path, capsys):
+    wipp_stub.store["imagesCollections/c1/images"] = [image("../escaped.tif")]
+    wipp_stub.routes[("GET", "imagesCollections/c1/images/i1/download")] = (
+        lambda *args: (200, b"tiff", {"Content-Type": "image/tiff"})
+    )
+    directory = tmp_path / "images"
+    cli.main(["download", "c1", str(directory)])
+    assert os.listdir(directory) == ["escaped.tif"]
+    assert not (tmp_path / "escaped.tif").exists()
+
+
+def test_failed_download_leaves_no_file(wipp_stub, tmp_path, monkeypatch):
+    wipp_stub.routes[("GET", "imagesCollections/c1/images/i1/download")] = (
+        lambda *args: (200, b"tiff", {"Content-Type": "image/tiff"})
+    )
+
+    def broken_content(self, r, chunk_size):
+        yield b"ti"
+        raise ConnectionError("connection reset")
+
+    monkeypatch.setattr(Wipp, "_iter_content", broken_content)
+    w = Wipp()
+    with pytest.raises(ConnectionError):
+        w.download_image("c1", WippImage(**image("a.tif")), tmp_path)
+    assert os.listdir(tmp_path) == []
+
+
+def test_delete_reports_each_id(wipp_stub, capsys):
+    wipp_stub.store["plugins"] = [plugin(1)]
+    cli.main(["--json", "delete", "plugins", "p1", "p2"])
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert results == [
+        {"id": "p1", "deleted": True},
+        {"id": "p2", "deleted": False},
+    ]
+    assert wipp_stub.store["plugins"] == []
+
+
+def test_token_is_sent(wipp_stub, capsys):
+    cli.main(["--token", "secret", "list", "plugins"])
+    _, _, headers = wipp_stub.requests("GET", "plugins")[0]
+    assert headers["Authorization"] == "Bearer secret"
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp
+from .conftest import plugin
+
+###############################################################################
+
+
+def set_cookie(request, query, body):
+    return 200, plugin(0), {"Set-Cookie": "JSESSIONID=alice; Path=/api"}
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_cookies_are_not_sent_to_other_users(wipp_stub, http2):
+    if http2:
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(3)]
+    wipp_stub.routes[("GET", "plugins/p0")] = set_cookie
+    alice = Wipp(http2=http2).with_token("alice")
+    bob = alice.with_token("bob")
+    alice.get_entity("plugins", "p0")
+    bob.get_entity("plugins", "p1")
+    _, _, headers = wipp_stub.requests("GET", "plugins/p1")[0]
+    assert headers["Authorization"] == "Bearer bob"
+    assert "Cookie" not in headers
+    alice.close()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import csv
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp, WippCsv
+from wipp_client.wipp import _iter_text_lines
+from .conftest import plugin
+
+###############################################################################
+
+DOWNLOAD = "csvCollections/c1/csv/{}/download"
+
+
+def split(data: bytes, size: int) -> list:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 1000])
+def test_text_lines_across_chunks(size):
+    data = "a,é\r\nb,ü\nlast".encode()
+    assert list(_iter_text_lines(split(data, size))) == ["a,é\r\n", "b,ü\n", "last"]
+
+
+def test_text_lines_only_split_on_newline():
+    data = "z,a b\x0cc\x85\r\nnext\n".encode()
+    lines = list(_iter_text_lines(split(data, 3)))
+    assert lines == ["z,a b\x0cc\x85\r\n", "next\n"]
+    assert list(csv.reader(lines)) == [["z", "a b\x0cc\x85"], ["next"]]
+
+
+def test_quoted_newlines_stay_in_their_value():
+    data = b'a,b\n"multi\nline",2\n'
+    rows = list(csv.reader(_iter_text_lines(split(data, 4))))
+    assert rows == [["a", "b"], ["multi\nline", "2"]]
+
+
+def serve_csv(wipp_stub, csv_id: str, text: str):
+    wipp_stub.routes[("GET", DOWNLOAD.format(csv_id))] = lambda *args: (
+        200,
+        text.encode(),
+        {"Content-Type": "text/csv"},
+    )
+    return WippCsv(id=csv_id, fileName=f"{csv_id}.csv", fileSize=len(text))
+
+
+def test_iter_csv_file_batches_columns(wipp_stub):
+    rows = "".join(f"{i},{i * 2},x\n" for i in range(25))
+    csv_file = serve_csv(wipp_stub, "f1", "a,b,c\n" + rows)
+    w = Wipp()
+    batches = list(
+        w.iter_csv_file("c1", csv_file, batch_size=10, columns=["b", "a"], chunk_size=7)
+    )
+    assert [len(batch["a"]) for batch in batches] == [10, 10, 5]
+    assert batches[0]["b"][:3] == ["0", "2", "4"]
+    assert list(batches[0]) == ["b", "a"]
+
+
+def test_iter_csv_file_missing_column(wipp_stub):
+    csv_file = serve_csv(wipp_stub, "f1", "a,b\n1,2\n")
+    w = Wipp()
+    with pytest.raises(ValueError, match="zz"):
+        list(w.iter_csv_file("c1", csv_file, columns=["zz"]))
+
+
+def test_short_rows_are_padded(wipp_stub):
+    csv_file = serve_csv(wipp_stub, "f1", "a,b\n1,2\n3\n")
+    w = Wipp()
+    assert list(w.iter_csv_file("c1", csv_file)) == [{"a": ["1", "3"], "b": ["2", ""]}]
+
+
+def test_requests_while_reading_csv_do_not_deadlock(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(1)]
+    csv_file = serve_csv(wipp_stub, "f1", "a\n" + "1\n" * 100)
+    w = Wipp(max_in_flight=1)
+    for batch in w.iter_csv_file("c1", csv_file, batch_size=10, chunk_size=16):
+        assert len(w.get_plugins()) == 1
+
+
+def test_iter_csv_collection(wipp_stub):
+    files = [serve_csv(wipp_stub, f"f{i}", f"a\n{i}\n{i}\n") for i in range(3)]
+    wipp_stub.store["csvCollections/c1/csv"] = [
+        {"id": f.id, "fileName": f.file_name, "fileSize": f.file_size} for f in files
+    ]
+    w = Wipp()
+    values = sorted(
+        value
+        for _, batch in w.iter_csv_collection("c1", workers=2)
+        for value in batch["a"]
+    )
+    assert values == ["0", "0", "1", "1", "2", "2"]
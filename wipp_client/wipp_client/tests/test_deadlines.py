@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp, WippTimeoutError
+from .conftest import plugin
+
+###############################################################################
+
+
+def slow_pages_after_first(request, query, body):
+    if query.get("page", "0") != "0":
+        time.sleep(0.5)
+
+
+def test_deadline_raises_timeout(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(5)]
+    wipp_stub.delay = 0.5
+    w = Wipp()
+    started = time.monotonic()
+    with pytest.raises(WippTimeoutError):
+        with w.deadline(0.1):
+            w.get_plugins()
+    assert time.monotonic() - started < 0.4
+
+
+def test_nested_deadlines_only_shorten():
+    w = Wipp.__new__(Wipp)
+    with w.deadline(0.1) as outer:
+        with w.deadline(10) as inner:
+            assert inner.expires_at == outer.expires_at
+        with w.deadline(0.01) as inner:
+            assert inner.expires_at < outer.expires_at
+
+
+def test_partial_deadline_returns_pages_fetched(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(45)]
+    wipp_stub.routes[("GET", "plugins")] = slow_pages_after_first
+    w = Wipp()
+    with w.deadline(0.2, partial=True) as deadline:
+        plugins = w.get_plugins()
+    assert deadline.partial_result
+    assert [p.id for p in plugins] == [f"p{i}" for i in range(20)]
+
+
+def test_deadline_does_not_apply_to_other_callers(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(45)]
+    wipp_stub.routes[("GET", "plugins")] = slow_pages_after_first
+    w = Wipp()
+    crawling = threading.Event()
+
+    def with_deadline():
+        with w.deadline(0.2):
+            crawling.set()
+            w.get_plugins()
+
+    def without_deadline():
+        crawling.wait(5)
+        time.sleep(0.05)
+        return w.get_plugins()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        hurried = executor.submit(with_deadline)
+        patient = executor.submit(without_deadline)
+        with pytest.raises(WippTimeoutError):
+            hurried.result()
+        assert len(patient.result()) == 45
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp, WippLazyEntity
+from .conftest import plugin
+
+###############################################################################
+
+
+def test_fields_keep_only_requested_fields(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(3)]
+    plugins = Wipp().get_plugins(fields=["id", "container_id"])
+    assert all(isinstance(p, WippLazyEntity) for p in plugins)
+    assert [p.container_id for p in plugins] == ["wipp/noop"] * 3
+    assert plugins[0].name is None
+
+
+def test_projection_returns_lazy_entities(wipp_stub):
+    # A projection leaves out required fields, which must not fail validation
+    wipp_stub.store["plugins"] = [{"id": f"p{i}", "name": f"p{i}"} for i in range(3)]
+    queries = []
+
+    def record(request, query, body):
+        queries.append(query)
+
+    wipp_stub.routes[("GET", "plugins")] = record
+    wipp_stub.routes[("GET", "plugins/search/findByNameContainingIgnoreCase")] = record
+    w = Wipp()
+    plugins = w.get_entities("plugins", projection="summary")
+    assert all(isinstance(p, WippLazyEntity) for p in plugins)
+    assert [p.name for p in plugins] == ["p0", "p1", "p2"]
+    assert [p.id for p in w.iter_entities("plugins", projection="summary")] == [
+        "p0",
+        "p1",
+        "p2",
+    ]
+    assert [p.name for p in w.get_plugins(projection="summary")] == ["p0", "p1", "p2"]
+    assert [p.name for p in w.search_plugins("p1", projection="summary")] == ["p1"]
+    assert {q["projection"] for q in queries} == {"summary"}
+
+
+@pytest.mark.parametrize(
+    "method, path, item",
+    [
+        ("search_plugins", "plugins", plugin(0)),
+        (
+            "get_csv_collections_csv_files",
+            "csvCollections/c1/csv",
+            {"id": "f0", "fileName": "a.csv", "fileSize": 1},
+        ),
+        (
+            "get_generic_data_files",
+            "genericDatas/g1/genericFile",
+            {"id": "f0", "fileName": "a.bin", "fileSize": 1},
+        ),
+        (
+            "iter_image_collections_images",
+            "imagesCollections/c1/images",
+            {"id": "f0", "fileName": "a.tif", "fileSize": 1},
+        ),
+    ],
+)
+def test_listings_accept_fields(wipp_stub, method, path, item):
+    wipp_stub.store[path] = [item]
+    argument = "plugin" if method.startswith("search") else path.split("/")[1]
+    entities = list(getattr(Wipp(), method)(argument, fields=["id"]))
+    assert [e.id for e in entities] == [item["id"]]
+    assert all(isinstance(e, WippLazyEntity) for e in entities)
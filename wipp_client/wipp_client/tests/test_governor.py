@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import threading
+import time
+
+# Relative
+from wipp_client import UNLIMITED, Wipp, WippGovernor
+from wipp_client.wipp import _TokenBucket
+
+###############################################################################
+
+
+def test_token_bucket_limits_rate():
+    bucket = _TokenBucket(rate=20, capacity=1)
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    # The first token is available at once, the next four take 1/20 s each
+    assert time.monotonic() - start >= 0.18
+
+
+def test_token_bucket_debt_delays_next_caller():
+    bucket = _TokenBucket(rate=100, capacity=100)
+    bucket.consume(110)
+    assert bucket.acquire(0) >= 0.09
+
+
+def test_governor_caps_requests_in_flight():
+    governor = WippGovernor(max_in_flight=2)
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def request():
+        nonlocal in_flight, peak
+        with governor.slot():
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == 2
+    assert governor.stats["requests"] == 6
+
+
+def test_configure_only_changes_given_limits():
+    governor = WippGovernor(requests_per_second=10, max_in_flight=2)
+    governor.configure(bytes_per_second=1000)
+    assert governor.requests_per_second == 10
+    assert governor.max_in_flight == 2
+    assert governor.bytes_per_second == 1000
+
+    governor.configure(max_in_flight=UNLIMITED)
+    assert governor.max_in_flight is None
+    assert governor.requests_per_second == 10
+
+
+def test_second_client_keeps_limits_of_the_first(wipp_stub):
+    first = Wipp(max_in_flight=2)
+    second = Wipp(requests_per_second=100)
+    assert first.governor is second.governor
+    assert second.governor.max_in_flight == 2
+    assert second.governor.requests_per_second == 100
+
+    Wipp(max_in_flight=UNLIMITED)
+    assert first.governor.max_in_flight is None
+    assert first.governor.requests_per_second == 100
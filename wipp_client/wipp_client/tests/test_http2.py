@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import logging
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp
+from .conftest import plugin
+
+###############################################################################
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+
+def test_http2_over_plain_http_warns_and_uses_http1(wipp_stub, caplog):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(25)]
+    with caplog.at_level(logging.WARNING):
+        w = Wipp(http2=True)
+    assert "only negotiated over https" in caplog.text
+    assert [p.id for p in w.get_plugins()] == [f"p{i}" for i in range(25)]
+    w.close()
+
+
+def test_http2_prior_knowledge_disables_http1(wipp_stub, monkeypatch, caplog):
+    clients = []
+
+    class Client(httpx.Client):
+        def __init__(self, **kwargs):
+            clients.append(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, "Client", Client)
+    monkeypatch.setattr(Wipp, "check_api_is_live", lambda self: {"code": 200})
+    with caplog.at_level(logging.WARNING):
+        Wipp(http2=True, http2_prior_knowledge=True).close()
+    assert clients == [{"http2": True, "http1": False}]
+    assert "only negotiated over https" not in caplog.text
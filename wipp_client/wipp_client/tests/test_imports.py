@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third party
+import requests
+
+# Relative
+from wipp_client import Wipp
+
+###############################################################################
+
+
+def collection(collection_id: str, importing: int, errors: int = 0) -> dict:
+    return {
+        "id": collection_id,
+        "name": collection_id,
+        "numberImportingImages": importing,
+        "numberOfImportErrors": errors,
+    }
+
+
+def test_wait_for_import_settles_collections(wipp_stub):
+    wipp_stub.store["imagesCollections"] = [collection("c1", 0), collection("c2", 1)]
+    polls = []
+
+    def get_c2(request, query, body):
+        polls.append(1)
+        # Still importing on the first poll only
+        return 200, collection("c2", 1 if len(polls) == 1 else 0, errors=1)
+
+    wipp_stub.routes[("GET", "imagesCollections/c2")] = get_c2
+    wipp_stub.store["imagesCollections/c2/images"] = [
+        {"id": "i1", "fileName": "bad.tif", "fileSize": 1, "importError": "corrupt"}
+    ]
+    w = Wipp()
+    statuses = w.wait_for_import(["c1", "c2"], interval=0.05, timeout=5)
+
+    assert statuses["c1"].settled and statuses["c1"].number_of_import_errors == 0
+    assert statuses["c2"].settled
+    assert statuses["c2"].import_errors == {"bad.tif": "corrupt"}
+
+
+def test_unknown_collection_is_reported_without_timeout(wipp_stub):
+    wipp_stub.store["imagesCollections"] = [collection("c1", 0)]
+    w = Wipp()
+    statuses = w.wait_for_import(["c1", "missing"], interval=0.05)
+
+    assert statuses["c1"].settled
+    assert not statuses["missing"].settled
+    assert statuses["missing"].error == "HTTP 404"
+
+
+def test_collections_failing_until_timeout_are_not_settled(wipp_stub):
+    wipp_stub.routes[("GET", "imagesCollections/c1")] = lambda *args: (503, {})
+    w = Wipp()
+    statuses = w.wait_for_import(["c1"], interval=0.01, timeout=0.2)
+    assert not statuses["c1"].settled
+
+
+def test_transient_failures_are_polled_again(wipp_stub):
+    wipp_stub.store["imagesCollections"] = [collection("c1", 0)]
+    failures = [(503, {}), (429, {})]
+    wipp_stub.routes[("GET", "imagesCollections/c1")] = lambda *args: (
+        failures.pop(0) if failures else None
+    )
+    w = Wipp()
+    statuses = w.wait_for_import(["c1"], interval=0.01, timeout=5)
+    assert statuses["c1"].settled and statuses["c1"].error is None
+    assert len(wipp_stub.requests("GET", "imagesCollections/c1")) == 3
+
+
+def test_connection_errors_only_affect_their_collection(wipp_stub, monkeypatch):
+    wipp_stub.store["imagesCollections"] = [collection("c1", 0), collection("c2", 0)]
+    w = Wipp()
+    request = w._request
+    failures = [requests.exceptions.ConnectionError("connection reset")]
+
+    def flaky_request(method, url, **kwargs):
+        if url.endswith("/c2") and failures:
+            raise failures.pop()
+        return request(method, url, **kwargs)
+
+    monkeypatch.setattr(w, "_request", flaky_request)
+    statuses = w.wait_for_import(["c1", "c2"], interval=0.01, timeout=5)
+    assert statuses["c1"].settled and statuses["c2"].settled
+    assert not failures
+
+
+def test_timeout_yields_collections_still_importing(wipp_stub):
+    wipp_stub.store["imagesCollections"] = [collection("c1", 3)]
+    w = Wipp()
+    statuses = w.wait_for_import(["c1"], interval=0.05, timeout=0.2)
+    assert not statuses["c1"].settled
+    assert statuses["c1"].error is None
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp
+from .conftest import plugin
+
+###############################################################################
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_entities_yields_every_page_in_order(wipp_stub, prefetch):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(45)]
+    w = Wipp()
+    ids = [p.id for p in w.iter_entities("plugins", prefetch=prefetch)]
+    assert ids == [f"p{i}" for i in range(45)]
+
+
+def test_iter_entities_stops_fetching_when_closed(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(200)]
+    w = Wipp()
+    entities = w.iter_entities("plugins", prefetch=2)
+    next(entities)
+    entities.close()
+    # Summary, the page being read and at most `prefetch` pages ahead
+    assert len(wipp_stub.requests("GET", "plugins")) <= 4
+
+
+def test_iter_image_collections_images(wipp_stub):
+    wipp_stub.store["imagesCollections/c1/images"] = [
+        {"id": f"i{i}", "fileName": f"{i}.tif", "fileSize": i} for i in range(25)
+    ]
+    w = Wipp()
+    images = list(w.iter_image_collections_images("c1", prefetch=2))
+    assert [image.file_size for image in images] == list(range(25))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third party
+import requests
+
+# Relative
+from wipp_client import JOB_UNAVAILABLE, Wipp
+
+###############################################################################
+
+
+def job(job_id: str, status: str, workflow: str = "wf1") -> dict:
+    return {"id": job_id, "name": job_id, "status": status, "wippWorkflow": workflow}
+
+
+def test_watcher_follows_jobs_until_finished(wipp_stub):
+    wipp_stub.store["jobs"] = [job("j1", "RUNNING"), job("j2", "SUCCESS")]
+    w = Wipp()
+    watcher = w.watch_jobs(["j1", "j2"], interval=0.01)
+    changes = []
+    watcher.on_change = lambda job, previous: changes.append((job.id, previous))
+
+    assert {job.id for job in watcher.poll()} == {"j1", "j2"}
+    wipp_stub.store["jobs"][0]["status"] = "ERROR"
+    jobs = watcher.run()
+
+    assert jobs["j1"].status == "ERROR"
+    assert ("j1", "RUNNING") in changes
+
+
+def test_deleted_jobs_are_finished(wipp_stub):
+    wipp_stub.store["jobs"] = [job("j1", "SUCCESS")]
+    wipp_stub.routes[("GET", "jobs/j3")] = lambda *args: (410, {})
+    w = Wipp()
+    jobs = w.watch_jobs(["j1", "deleted", "j3"], interval=0.01).run()
+
+    assert jobs["j1"].status == "SUCCESS"
+    assert jobs["deleted"].status == JOB_UNAVAILABLE
+    assert jobs["j3"].status == JOB_UNAVAILABLE and jobs["j3"].finished
+
+
+def test_transient_failures_keep_jobs_pending(wipp_stub):
+    wipp_stub.store["jobs"] = [job("j1", "RUNNING")]
+    failures = [(503, {})]
+    wipp_stub.routes[("GET", "jobs/j1")] = lambda *args: (
+        failures.pop() if failures else None
+    )
+    w = Wipp()
+    watcher = w.watch_jobs(["j1"], interval=0.01)
+    assert watcher.poll() == []
+    assert watcher.pending == ["j1"]
+    assert [job.status for job in watcher.poll()] == ["RUNNING"]
+
+
+def test_exception_only_affects_its_job(wipp_stub, monkeypatch):
+    wipp_stub.store["jobs"] = [job("j1", "RUNNING"), job("j2", "RUNNING")]
+    w = Wipp()
+    request = w._request
+
+    def flaky_request(method, url, **kwargs):
+        if url.endswith("/j2"):
+            raise requests.exceptions.ConnectionError("connection reset")
+        return request(method, url, **kwargs)
+
+    monkeypatch.setattr(w, "_request", flaky_request)
+    watcher = w.watch_jobs(["j1", "j2"], interval=0.01)
+    assert [job.id for job in watcher.poll()] == ["j1"]
+    assert watcher.pending == ["j1", "j2"]
+    assert watcher.jobs["j2"] is None
+
+    # Responses which can not be parsed are not retried
+    monkeypatch.setattr(w, "_request", request)
+    wipp_stub.routes[("GET", "jobs/j2")] = lambda *args: (200, {"id": "j2"})
+    watcher.poll()
+    assert watcher.jobs["j2"].status == JOB_UNAVAILABLE
+    assert watcher.pending == ["j1"]
+
+
+def test_jobs_of_a_workflow_are_polled_with_one_search(wipp_stub):
+    wipp_stub.store["jobs"] = [job(f"j{i}", "RUNNING") for i in range(10)]
+    searches = []
+
+    def search(request, query, body):
+        searches.append(query["wippWorkflow"])
+        jobs = [j for j in wipp_stub.store["jobs"] if j["wippWorkflow"] == "wf1"]
+        return 200, {"_embedded": {"jobs": jobs}}
+
+    wipp_stub.routes[("GET", "jobs/search/findByWippWorkflow")] = search
+    w = Wipp()
+    watcher = w.watch_jobs([f"j{i}" for i in range(10)])
+    watcher.poll()
+    assert len(wipp_stub.requests("GET")) == 11  # API check and one GET per job
+
+    for j in wipp_stub.store["jobs"]:
+        j["status"] = "SUCCESS"
+    assert len(watcher.poll()) == 10
+    assert searches == ["wf1"]
+    assert len(wipp_stub.requests("GET")) == 12
+    assert watcher.pending == []
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import pickle
+from datetime import datetime
+
+# Third party
+import pytest
+from pydantic import ValidationError
+
+# Relative
+from wipp_client import Wipp, WippImageCollection, WippLazyEntity, WippPlugin
+from .conftest import plugin
+
+###############################################################################
+
+RAW = {
+    "id": "c1",
+    "name": "collection",
+    "creationDate": "2021-01-01T00:00:00.000+0000",
+    "numberOfImages": "12",
+    "extraField": 3,
+}
+
+
+def test_fields_are_converted_on_read():
+    entity = WippLazyEntity(dict(RAW), WippImageCollection)
+    assert entity.creation_date == datetime.fromisoformat("2021-01-01T00:00:00+00:00")
+    assert entity.number_of_images == 12
+    assert entity.extra_field == 3
+    assert entity.locked is None
+    with pytest.raises(AttributeError):
+        entity.not_a_field
+
+
+def test_invalid_fields_raise_when_read():
+    entity = WippLazyEntity({**RAW, "numberOfImages": "many"}, WippImageCollection)
+    assert entity.name == "collection"
+    with pytest.raises(ValidationError):
+        entity.number_of_images
+
+
+def test_model_methods_and_conversion():
+    entity = WippLazyEntity(dict(RAW), WippImageCollection)
+    model = entity.to_model()
+    assert isinstance(model, WippImageCollection)
+    assert str(entity) == str(model)
+    assert entity.dict() == model.dict()
+    assert pickle.loads(pickle.dumps(entity)) == entity
+
+
+def test_lazy_listings(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(3)]
+    w = Wipp()
+    plugins = w.get_plugins(lazy=True)
+    assert all(isinstance(p, WippLazyEntity) for p in plugins)
+    assert [p.to_model() for p in plugins] == w.get_plugins()
+    assert isinstance(w.get_plugins()[0], WippPlugin)
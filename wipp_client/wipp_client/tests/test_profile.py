@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import pstats
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp, WippProfile
+from .conftest import plugin
+
+###############################################################################
+
+
+def test_endpoint_templates():
+    profile = WippProfile("/api")
+    assert profile.endpoint("http://wipp/api/imagesCollections/c1/images") == (
+        "imagesCollections/{id}/images"
+    )
+    assert profile.endpoint("http://wipp/api/plugins?page=2") == "plugins"
+    assert profile.endpoint(
+        "/api/plugins/search/findByNameContainingIgnoreCase?name=a"
+    ) == ("plugins/search/findByNameContainingIgnoreCase")
+
+
+def test_phases_are_recorded_per_endpoint(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(45)]
+    w = Wipp()
+    with w.profile() as profile:
+        w.get_plugins()
+    phases = profile.phases
+    # One summary and three pages
+    assert phases["network"]["calls"] == 4
+    assert phases["decode"]["calls"] >= 3
+    assert phases["model"]["calls"] == 3
+    assert phases["flatten"]["calls"] == 1
+    assert {endpoint for endpoint, _ in profile.timings} == {"plugins"}
+    assert profile.elapsed >= phases["flatten"]["wall"]
+    lines = profile.summary().splitlines()
+    assert lines[0].split() == [
+        "endpoint",
+        "phase",
+        "calls",
+        "wall",
+        "(s)",
+        "cpu",
+        "(s)",
+    ]
+    assert lines[-1].startswith("block")
+
+    # Calls outside of the block are not recorded
+    w.get_plugins()
+    assert profile.phases == phases
+
+
+def test_dumps(wipp_stub, tmp_path):
+    wipp_stub.store["plugins"] = [plugin(0)]
+    w = Wipp()
+    with w.profile() as profile:
+        w.get_plugins()
+    with pytest.raises(ValueError):
+        profile.dump_stats(tmp_path / "wipp.prof")
+    profile.dump_collapsed(tmp_path / "wipp.collapsed")
+    stacks = (tmp_path / "wipp.collapsed").read_text().splitlines()
+    assert "plugins;network" in [line.rsplit(" ", 1)[0] for line in stacks]
+
+    with w.profile(cprofile=True) as profile:
+        w.get_plugins()
+    profile.dump_stats(tmp_path / "wipp.prof")
+    stats = pstats.Stats(str(tmp_path / "wipp.prof"))
+    assert any(name == "get_plugins" for (_, _, name) in stats.stats)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+from datetime import datetime, timedelta, timezone
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp
+from wipp_client.wipp import _literal_part
+
+###############################################################################
+
+NOW = datetime.now(timezone.utc)
+
+
+def collection(i: int, name: str, age: timedelta) -> dict:
+    created = (NOW - age).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+    return {"id": f"c{i}", "name": name, "creationDate": created}
+
+
+@pytest.fixture
+def collections(wipp_stub):
+    wipp_stub.store["imagesCollections"] = [
+        collection(0, "tmp-a", timedelta(days=3)),
+        collection(1, "tmp-b", timedelta(hours=1)),
+        collection(2, "keep-tmp", timedelta(days=3)),
+        collection(3, "TMP-c", timedelta(days=3)),
+    ]
+    return wipp_stub
+
+
+def ids(results) -> list:
+    return sorted(result.id for result in results)
+
+
+def remaining(stub) -> list:
+    return sorted(item["id"] for item in stub.store["imagesCollections"])
+
+
+def test_literal_part():
+    assert _literal_part("tmp-*") == "tmp-"
+    assert _literal_part("*-[0-9]-nightly?") == "-nightly"
+    assert _literal_part("*") == ""
+
+
+def test_dry_run_only_reports_matches(collections):
+    results = Wipp().purge("imagesCollections", name_pattern="tmp-*", dry_run=True)
+    assert ids(results) == ["c0", "c1"]
+    assert all(result.deleted is None for result in results)
+    assert collections.requests("DELETE") == []
+    # Only the literal part of the pattern was searched on the server
+    assert collections.requests(
+        "GET", "imagesCollections/search/findByNameContainingIgnoreCase"
+    )
+
+
+def test_purge_by_name_and_age(collections):
+    results = Wipp().purge(
+        "imagesCollections", name_pattern="tmp-*", older_than=timedelta(days=1)
+    )
+    assert ids(results) == ["c0"]
+    assert results[0].deleted
+    assert remaining(collections) == ["c1", "c2", "c3"]
+
+
+def test_purge_by_age(collections):
+    results = Wipp().purge("imagesCollections", older_than=timedelta(days=1))
+    assert ids(results) == ["c0", "c2", "c3"]
+    assert remaining(collections) == ["c1"]
+
+
+def test_failed_deletions_are_reported(collections):
+    collections.routes[("DELETE", "imagesCollections/c1")] = lambda *args: (
+        500,
+        {"error": "Internal Server Error"},
+    )
+    results = {r.id: r for r in Wipp().purge("imagesCollections", "tmp-*")}
+    assert results["c0"].deleted and results["c0"].error is None
+    assert results["c1"].deleted is False
+    assert results["c1"].error == "request failed"
+    assert "failed" in str(results["c1"])
+
+
+def test_purge_requires_criteria(wipp_stub):
+    with pytest.raises(ValueError):
+        Wipp().purge("imagesCollections")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Relative
+from wipp_client import Wipp
+from wipp_client.wipp import _LRUByteCache
+
+###############################################################################
+
+FETCHING = "pyramids/py1/fetching/0_files/{level}/{x}_{y}.png"
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = _LRUByteCache(max_bytes=6)
+    cache.put("a", b"aa")
+    cache.put("b", b"bb")
+    cache.get("a")
+    cache.put("c", b"cccc")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"aa"
+    assert cache.size == 6
+    # Values larger than the whole budget are not cached
+    cache.put("d", b"d" * 7)
+    assert cache.get("d") is None
+
+
+def serve_tiles(wipp_stub, level: int, columns: int, rows: int):
+    for x in range(columns):
+        for y in range(rows):
+            tile = f"{level}/{x}/{y}".encode()
+            wipp_stub.routes[("GET", FETCHING.format(level=level, x=x, y=y))] = (
+                lambda request, query, body, tile=tile: (
+                    200,
+                    tile,
+                    {"Content-Type": "image/png"},
+                )
+            )
+
+
+def test_region_fetches_covering_tiles_once(wipp_stub):
+    serve_tiles(wipp_stub, 10, 3, 2)
+    w = Wipp()
+    pyramid = w.open_pyramid("py1")
+    tiles = pyramid.region(10, left=100, top=0, width=300, height=300)
+
+    assert set(tiles) == {(10, x, y) for x in (0, 1) for y in (0, 1)}
+    assert tiles[(10, 1, 0)] == b"10/1/0"
+    pyramid.region(10, left=100, top=0, width=300, height=300)
+    assert len(wipp_stub.requests("GET", FETCHING.format(level=10, x=1, y=0))) == 1
+
+
+def test_disk_cache_survives_a_new_pyramid(wipp_stub, tmp_path):
+    serve_tiles(wipp_stub, 10, 1, 1)
+    w = Wipp()
+    assert w.open_pyramid("py1", cache_dir=tmp_path).tile(10, 0, 0) == b"10/0/0"
+    assert w.open_pyramid("py1", cache_dir=tmp_path).tile(10, 0, 0) == b"10/0/0"
+    assert len(wipp_stub.requests("GET", FETCHING.format(level=10, x=0, y=0))) == 1
+    assert w.open_pyramid("py1").tile(10, 5, 5) is None
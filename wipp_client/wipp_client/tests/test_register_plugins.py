@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import json
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp
+from .conftest import plugin
+
+###############################################################################
+
+
+def manifest(directory, file_name: str, content):
+    path = directory / file_name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content if isinstance(content, str) else json.dumps(content))
+    return str(path)
+
+
+@pytest.fixture
+def manifests(tmp_path):
+    manifest(tmp_path, "a.json", plugin(0, id=None))
+    manifest(tmp_path, "b.json", plugin(1, id=None))
+    manifest(tmp_path, "c.json", plugin(1, id=None))
+    manifest(tmp_path, "d.json", "{not json")
+    manifest(tmp_path, "e.json", {"name": "incomplete"})
+    manifest(tmp_path, "g.json", [1, 2])
+    manifest(tmp_path, "nested/f.json", plugin(2, id=None))
+    return tmp_path
+
+
+def by_file(results) -> dict:
+    return {result.path.rsplit("/", 1)[-1]: result for result in results}
+
+
+def test_only_new_plugins_are_created(wipp_stub, manifests):
+    wipp_stub.store["plugins"] = [plugin(0)]
+    results = by_file(Wipp().register_plugins(manifests))
+    assert {name: r.status for name, r in results.items()} == {
+        "a.json": "exists",
+        "b.json": "created",
+        "c.json": "duplicate",
+        "d.json": "invalid",
+        "e.json": "invalid",
+        "g.json": "invalid",
+    }
+    assert results["g.json"].error == "manifest is not a JSON object"
+    assert results["a.json"].id == "p0"
+    assert results["b.json"].id is not None
+    assert [p["name"] for p in wipp_stub.store["plugins"]] == ["plugin0", "plugin1"]
+    # The index of existing plugins is built from a single listing
+    assert len(wipp_stub.requests("GET", "plugins")) == 2
+
+
+def test_dry_run_and_recursive_search(wipp_stub, manifests):
+    results = by_file(Wipp().register_plugins(manifests, recursive=True, dry_run=True))
+    assert results["f.json"].status == "new"
+    assert results["b.json"].status == "new"
+    assert wipp_stub.requests("POST") == []
+
+
+def test_failed_creations_are_reported(wipp_stub, manifests):
+    wipp_stub.routes[("POST", "plugins")] = lambda *args: (
+        400,
+        {"error": "Bad Request"},
+    )
+    results = by_file(Wipp().register_plugins(manifests))
+    assert results["b.json"].status == "failed"
+    assert results["b.json"].error
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp
+from wipp_client.wipp import _SingleFlight
+from .conftest import plugin
+
+###############################################################################
+
+
+def test_concurrent_calls_share_one_result():
+    flight = _SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fn(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return [value]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", fn, 1)
+        started.wait(5)
+        followers = [executor.submit(flight.do, "key", fn, 2) for _ in range(3)]
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+
+
+def test_exception_is_shared_and_key_released():
+    flight = _SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+    # The failed call is forgotten, the next one runs again
+    assert flight.do("key", lambda: 42) == 42
+
+
+def test_different_keys_are_not_coalesced():
+    flight = _SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+
+
+def test_get_entities_coalesces_identical_listings(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(45)]
+    wipp_stub.delay = 0.1
+    w = Wipp()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: w.get_plugins(), range(4)))
+
+    assert all(len(result) == 45 for result in results)
+    # One summary and three pages, whatever the number of callers
+    assert len(wipp_stub.requests("GET", "plugins")) == 4
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp, WippImage, WippPlugin, WippSnapshot
+from .conftest import plugin
+
+###############################################################################
+
+IMAGES = [
+    WippImage(
+        id=f"i{i}", fileName=f"tile_{i}é.tif", fileSize=i * 1000, importing=i % 2 == 0
+    )
+    for i in range(5)
+] + [WippImage(id="i5", fileName="empty.tif", fileSize=0, importError="bad tiff")]
+
+
+def total_size(snapshot: WippSnapshot) -> int:
+    return sum(snapshot.column("file_size"))
+
+
+def test_file_round_trip(tmp_path):
+    with WippSnapshot.write(IMAGES, tmp_path / "images.snap") as snapshot:
+        assert len(snapshot) == len(IMAGES)
+        assert snapshot.model is WippImage
+        assert [entity.to_model() for entity in snapshot] == IMAGES
+        assert snapshot[-1].import_error == "bad tiff"
+        assert snapshot[1].import_error is None
+        assert [entity.id for entity in snapshot[1:3]] == ["i1", "i2"]
+        assert "importError" not in snapshot.raw(0)
+        with pytest.raises(IndexError):
+            snapshot[len(IMAGES)]
+
+
+def test_columns(tmp_path):
+    with WippSnapshot.write(IMAGES, tmp_path / "images.snap") as snapshot:
+        sizes = snapshot.column("file_size")
+        assert isinstance(sizes, memoryview)
+        assert list(sizes) == [image.file_size for image in IMAGES]
+        sizes.release()
+        assert snapshot.column("fileName") == [image.file_name for image in IMAGES]
+        assert snapshot.column("importing")[:2] == [True, False]
+
+
+def test_nested_fields_round_trip(tmp_path):
+    plugins = [
+        WippPlugin(**plugin(i, inputs=[{"name": "in", "type": "x"}])) for i in range(3)
+    ]
+    with WippSnapshot.write(plugins, tmp_path / "plugins.snap") as snapshot:
+        assert [entity.to_model() for entity in snapshot] == plugins
+
+
+def test_file_snapshots_pickle_as_their_path(tmp_path):
+    snapshot = WippSnapshot.write(IMAGES, tmp_path / "images.snap")
+    data = pickle.dumps(snapshot)
+    assert len(data) < 200
+    with pickle.loads(data) as copy:
+        assert [entity.to_model() for entity in copy] == IMAGES
+    snapshot.close()
+
+
+def test_shared_memory_snapshots(tmp_path):
+    snapshot = WippSnapshot.to_shared_memory(IMAGES)
+    try:
+        assert snapshot.name is not None
+        with pickle.loads(pickle.dumps(snapshot)) as copy:
+            assert copy[2].to_model() == IMAGES[2]
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:
+            pytest.skip("fork is not available")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            assert executor.submit(total_size, snapshot).result() == total_size(
+                snapshot
+            )
+    finally:
+        snapshot.close()
+        snapshot.unlink()
+
+
+def test_invalid_snapshots_are_rejected(tmp_path):
+    path = tmp_path / "invalid.snap"
+    path.write_bytes(b"not a snapshot at all")
+    with pytest.raises(ValueError):
+        WippSnapshot.open(path)
+
+
+def test_snapshot_entities(wipp_stub, tmp_path):
+    wipp_stub.store["imagesCollections/c1/images"] = [
+        image.dict(by_alias=True, exclude_none=True) for image in IMAGES * 10
+    ]
+    with Wipp().snapshot_entities(
+        "images", tmp_path / "images.snap", path_prefix="imagesCollections/c1"
+    ) as snapshot:
+        assert len(snapshot) == 60
+        assert snapshot.model is WippImage
+        assert snapshot[59].to_model() == IMAGES[-1]
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import threading
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp
+from wipp_client.wipp import _parse_stitching_positions
+from .conftest import plugin
+
+###############################################################################
+
+np = pytest.importorskip("numpy")
+
+POSITIONS = "stitchingVectors/sv1/timeslices/1/globalPositions"
+
+LINES = b"".join(
+    f"file: img_r{r:03d}_c{c:03d}.ome.tif; corr: 0.{r}5; "
+    f"position: ({c * 1000}, {r * -10}); grid: ({c}, {r});\n".encode()
+    for r in range(10)
+    for c in range(50)
+)
+
+
+def test_parse_stitching_positions():
+    positions = _parse_stitching_positions(
+        b"file: a b.tif; corr: 0.89; position: (0, -1024); grid: (0, 1);\n"
+        b"file:c.tif;corr:1;position:(12,3);grid:(4,5);\n"
+        b"not a position line\n"
+    )
+    assert list(positions["file"]) == ["a b.tif", "c.tif"]
+    assert list(positions["corr"]) == [0.89, 1.0]
+    assert list(positions["x"]) == [0, 12]
+    assert list(positions["y"]) == [-1024, 3]
+    assert list(positions["grid_x"]) == [0, 4]
+    assert list(positions["grid_y"]) == [1, 5]
+    assert positions["x"].dtype == np.int64
+
+
+def test_parse_empty_text():
+    positions = _parse_stitching_positions(b"")
+    assert all(len(column) == 0 for column in positions.values())
+
+
+def test_stitching_vector_is_parsed_across_chunks(wipp_stub):
+    wipp_stub.routes[("GET", POSITIONS)] = lambda *args: (
+        200,
+        LINES,
+        {"Content-Type": "text/plain"},
+    )
+    w = Wipp()
+    batches = list(w.iter_stitching_vector("sv1", chunk_size=1000))
+    assert len(batches) > 1
+    positions = w.get_stitching_vector_positions("sv1")
+    assert len(positions["x"]) == 500
+    assert positions["file"][51] == "img_r001_c001.ome.tif"
+    assert positions["y"][51] == -10
+
+
+def test_requests_while_streaming_do_not_deadlock(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(1)]
+    wipp_stub.routes[("GET", POSITIONS)] = lambda *args: (
+        200,
+        LINES,
+        {"Content-Type": "text/plain"},
+    )
+    w = Wipp(max_in_flight=1, coalesce_requests=False)
+    done = []
+
+    def consume():
+        for batch in w.iter_stitching_vector("sv1", chunk_size=1000):
+            done.append(len(w.get_plugins()))
+
+    thread = threading.Thread(target=consume, daemon=True)
+    thread.start()
+    thread.join(10)
+    assert not thread.is_alive()
+    assert done and all(n == 1 for n in done)
+
+
+def test_abandoned_stream_releases_its_slot(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(1)]
+    wipp_stub.routes[("GET", POSITIONS)] = lambda *args: (
+        200,
+        LINES,
+        {"Content-Type": "text/plain"},
+    )
+    w = Wipp(max_in_flight=1)
+    batches = w.iter_stitching_vector("sv1", chunk_size=1000)
+    next(batches)
+    # The generator is neither exhausted nor closed
+    assert w.governor._semaphore.acquire(timeout=5)
+    w.governor._semaphore.release()
+
+
+def test_streamed_bytes_are_rate_limited(wipp_stub):
+    wipp_stub.routes[("GET", POSITIONS)] = lambda *args: (
+        200,
+        LINES,
+        {"Content-Type": "text/plain"},
+    )
+    # The bucket starts with a second worth of bytes, 4 of the 6 bodies
+    w = Wipp(bytes_per_second=len(LINES) * 4)
+    for _ in range(6):
+        list(w.iter_stitching_vector("sv1", chunk_size=1000))
+    assert w.governor.stats["throttled_seconds"] > 0.2
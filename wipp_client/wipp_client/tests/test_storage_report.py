@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import csv
+
+# Relative
+from wipp_client import Wipp
+
+###############################################################################
+
+
+def fill(wipp_stub):
+    wipp_stub.store["imagesCollections"] = [
+        {
+            "id": f"i{i}",
+            "name": f"images{i}",
+            "owner": "alice" if i % 2 else "bob",
+            "imagesTotalSize": 100,
+            "metadataFilesTotalSize": 1,
+        }
+        for i in range(30)
+    ]
+    wipp_stub.store["csvCollections"] = [
+        {"id": "c1", "name": "csv", "owner": "alice", "csvTotalSize": 7}
+    ]
+    wipp_stub.store["genericDatas"] = [
+        # Collections of older API versions have no owner
+        {"id": "g1", "name": "generic", "fileTotalSize": None}
+    ]
+
+
+def test_storage_report_totals(wipp_stub):
+    fill(wipp_stub)
+    report = Wipp().get_storage_report()
+    assert report.complete
+    assert report.totals["all"] == {
+        "collections": 32,
+        "images_total_size": 3000,
+        "metadata_files_total_size": 30,
+        "csv_total_size": 7,
+        "file_total_size": 0,
+    }
+
+
+def test_storage_report_grouped_by_owner(wipp_stub, tmp_path):
+    fill(wipp_stub)
+    reports = list(Wipp().iter_storage_report(group_by="owner", workers=2))
+    # One partial report per page: 2 of images, 1 of CSV and 1 of generic data
+    assert [r.pages_done for r in reports] == [1, 2, 3, 4]
+    report = reports[-1]
+    assert report.totals["alice"]["collections"] == 16
+    assert report.totals["bob"]["images_total_size"] == 1500
+    assert report.totals["None"]["collections"] == 1
+
+    report.to_csv(tmp_path / "report.csv")
+    with open(tmp_path / "report.csv") as f:
+        rows = {row["owner"]: row for row in csv.DictReader(f)}
+    assert rows["alice"]["total_size"] == str(1500 + 15 + 7)
+
+
+def test_failed_listings_are_recorded(wipp_stub):
+    fill(wipp_stub)
+    wipp_stub.routes[("GET", "csvCollections")] = lambda *args: (500, {})
+    wipp_stub.routes[("GET", "imagesCollections")] = lambda request, query, body: (
+        (503, {}) if query.get("page") == "1" else None
+    )
+    report = Wipp().get_storage_report()
+    assert not report.complete
+    assert report.errors == {
+        "csvCollections": "request failed",
+        "imagesCollections page 1": "request failed",
+    }
+    # The collections which could be listed are still counted
+    assert report.totals["all"]["collections"] == 21
+    assert "csvCollections\tfailed" in str(report)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third party
+import pytest
+
+# Relative
+from wipp_client import Wipp
+
+###############################################################################
+
+IMAGES = "imagesCollections/c1/images"
+
+
+@pytest.fixture
+def collection(wipp_stub, tmp_path):
+    """Collection with a.tif (same size as local), b.tif (different size) and
+    old.tif (missing locally), next to a directory with a.tif, b.tif and c.tif"""
+    wipp_stub.store[IMAGES] = [
+        {"id": "ia", "fileName": "a.tif", "fileSize": 1},
+        {"id": "ib", "fileName": "b.tif", "fileSize": 1},
+        {"id": "iold", "fileName": "old.tif", "fileSize": 1},
+    ]
+    uploads = []
+
+    def upload(request, query, body):
+        uploads.append(body)
+        return 200, {}
+
+    wipp_stub.routes[("POST", "imagesCollections/c1/upload")] = upload
+    (tmp_path / "a.tif").write_bytes(b"a")
+    (tmp_path / "b.tif").write_bytes(b"bb")
+    (tmp_path / "c.tif").write_bytes(b"c")
+    return uploads
+
+
+def test_sync_plan(wipp_stub, tmp_path, collection):
+    w = Wipp()
+    plan = w.sync_image_collection("c1", tmp_path, delete_extra=True, dry_run=True)
+    assert plan.to_upload == ["c.tif"]
+    assert plan.to_replace == ["b.tif"]
+    assert [image.file_name for image in plan.to_delete] == ["old.tif"]
+    assert plan.unchanged == 1
+    assert collection == []
+
+
+def test_sync_applies_plan(wipp_stub, tmp_path, collection):
+    w = Wipp()
+    plan = w.sync_image_collection("c1", tmp_path, delete_extra=True)
+    assert plan.errors == {}
+    assert len(collection) == 2
+    assert [i["id"] for i in wipp_stub.store[IMAGES]] == ["ia"]
+
+
+def test_replace_is_skipped_when_delete_fails(wipp_stub, tmp_path, collection):
+    wipp_stub.routes[("DELETE", IMAGES + "/ib")] = lambda *args: (500, {})
+    w = Wipp()
+    plan = w.sync_image_collection("c1", tmp_path)
+    assert "b.tif" in plan.errors
+    # Only c.tif was uploaded, b.tif was not duplicated
+    assert len(collection) == 1
+    assert b"c.tif" in collection[0]
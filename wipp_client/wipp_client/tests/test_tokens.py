@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import threading
+import time
+
+# Relative
+from wipp_client import Wipp
+from wipp_client.wipp import _TokenRefresher
+from .conftest import plugin
+
+###############################################################################
+
+
+class Provider:
+    def __init__(self, expires_in=None, delay=0.0):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        time.sleep(self.delay)
+        self.calls += 1
+        return {"access_token": f"t{self.calls}", "expires_in": self.expires_in}
+
+
+def test_token_formats():
+    assert _TokenRefresher(lambda: "t").headers() == {"Authorization": "Bearer t"}
+    assert _TokenRefresher(lambda: ("t", 60)).headers() == {"Authorization": "Bearer t"}
+    assert _TokenRefresher(Provider(60)).headers() == {"Authorization": "Bearer t1"}
+
+
+def test_concurrent_refreshes_share_one_call():
+    provider = Provider(delay=0.1)
+    tokens = _TokenRefresher(provider)
+    stale = {"Authorization": "Bearer t0"}
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(tokens.refresh(stale)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert provider.calls == 1
+    assert results == [{"Authorization": "Bearer t1"}] * 8
+    # Headers rejected after the refresh get a new token
+    assert tokens.refresh(results[0]) == {"Authorization": "Bearer t2"}
+
+
+def test_expired_tokens_are_refreshed():
+    provider = Provider(expires_in=0)
+    tokens = _TokenRefresher(provider)
+    assert tokens.headers() == {"Authorization": "Bearer t1"}
+    assert tokens.headers() == {"Authorization": "Bearer t2"}
+
+
+def test_tokens_close_to_expiry_are_refreshed_in_background():
+    provider = Provider(expires_in=10)
+    tokens = _TokenRefresher(provider, margin=30)
+    assert tokens.headers() == {"Authorization": "Bearer t1"}
+    # Still valid, returned right away while the new token is fetched
+    assert tokens.headers() == {"Authorization": "Bearer t1"}
+    for _ in range(100):
+        if provider.calls == 2:
+            break
+        time.sleep(0.01)
+    assert tokens.headers() == {"Authorization": "Bearer t2"}
+
+
+def test_rejected_requests_are_retried_with_a_new_token(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(0)]
+    wipp_stub.routes[("GET", "plugins/p0")] = lambda request, query, body: (
+        (401, {"error": "Unauthorized"})
+        if request.headers["Authorization"] == "Bearer t1"
+        else None
+    )
+    provider = Provider()
+    w = Wipp()
+    w.set_token_provider(provider)
+    assert w.get_entity("plugins", "p0").id == "p0"
+    assert provider.calls == 2
+    authorizations = [
+        headers["Authorization"]
+        for (_, _, headers) in wipp_stub.requests("GET", "plugins/p0")
+    ]
+    assert authorizations == ["Bearer t1", "Bearer t2"]
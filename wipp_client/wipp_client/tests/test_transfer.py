@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import gzip
+import json
+
+# Relative
+from wipp_client import Wipp, WippPlugin
+from .conftest import plugin
+
+###############################################################################
+
+
+def test_large_request_bodies_are_gzipped(wipp_stub):
+    received = []
+
+    def create(request, query, body):
+        assert request.headers["Content-Encoding"] == "gzip"
+        received.append(json.loads(gzip.decompress(body)))
+        return 201, {**received[-1], "id": "p1"}
+
+    wipp_stub.routes[("POST", "plugins")] = create
+    w = Wipp(compress_requests_min_size=100)
+    created = w.create_plugin(WippPlugin(**plugin(1, description="x" * 1000)))
+
+    assert created.id == "p1"
+    assert received[0]["description"] == "x" * 1000
+    stats = w.transfer.stats
+    assert stats["sent_wire_bytes"] < stats["sent_bytes"]
+    assert stats["saved_bytes"] > 0
+
+
+def test_small_request_bodies_are_not_gzipped(wipp_stub):
+    w = Wipp(compress_requests_min_size=10_000)
+    w.create_plugin(WippPlugin(**plugin(1)))
+    _, _, headers = wipp_stub.requests("POST", "plugins")[0]
+    assert "Content-Encoding" not in headers
+
+
+def test_received_bytes_are_counted(wipp_stub):
+    wipp_stub.store["plugins"] = [plugin(i) for i in range(5)]
+    w = Wipp()
+    before = w.transfer.stats["received_bytes"]
+    w.get_plugins()
+    assert w.transfer.stats["received_bytes"] > before
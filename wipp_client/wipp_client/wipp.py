@@ -3,16 +3,54 @@
 
 # Standard library
 import os
+import re
+import csv
+import copy
+import gzip
 import json
+import queue
+import codecs
+import cProfile
+import contextvars
+import fnmatch
+import glob
 import logging
+import mmap
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from types import resolve_bases
-from datetime import datetime
-from typing import Any, List, Tuple, Union, Optional
+from datetime import datetime, timedelta, timezone
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union, Optional
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 
 # Third party
 import requests
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+from pydantic.fields import SHAPE_SINGLETON
+
+# Optional HTTP/2 transport
+try:
+    import h2  # noqa: F401
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional array support
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+
+# Content codings supported by urllib3 here ("gzip,deflate" plus br/zstd if installed)
+from urllib3.util.request import ACCEPT_ENCODING
 
 # Relative
 
@@ -26,6 +64,601 @@ def snake_case_to_lower_camel_case(string: str) -> str:
     return words[0] + "".join(word.capitalize() for word in words[1:])
 
 
+class _SingleFlight:
+    """Coalesce concurrent calls sharing the same key into a single call
+
+    The first caller for a key runs the function, callers arriving while it is
+    in flight block and receive the same result (or exception)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, *args, **kwargs):
+        """Call fn(*args, **kwargs) or wait for the result of the call already in
+        flight for `key`"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class _ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor running tasks in a copy of the submitter's context,
+    so deadlines set with Wipp.deadline() also apply to parallel requests"""
+
+    def submit(self, fn, *args, **kwargs):
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def _httpx_timeout(timeout):
+    """Convert a requests style (connect, read) timeout for httpx"""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return timeout
+
+
+# Cookies set by WIPP (such as JSESSIONID) are never stored, since connections
+# and sessions are shared between the with_token() copies of other users
+_REJECT_COOKIES = DefaultCookiePolicy(allowed_domains=[])
+
+
+def _wire_bytes(r) -> int:
+    """Bytes of a streamed requests or httpx response body read from the wire"""
+    if hasattr(r, "num_bytes_downloaded"):
+        return r.num_bytes_downloaded
+    return r.raw.tell()
+
+
+class WippDeadline:
+    """Time budget shared by all requests made within Wipp.deadline()"""
+
+    def __init__(self, seconds: float, partial: bool = False):
+        self.expires_at = time.monotonic() + seconds
+        self.partial = partial
+        # Set when a listing returned only the pages fetched before expiry
+        self.partial_result = False
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+# Deadline of the requests made in the current context (see Wipp.deadline)
+_current_deadline = contextvars.ContextVar("wipp_deadline", default=None)
+
+
+class _TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding at most `capacity`
+
+    Tokens can be consumed after the fact (such as response bytes), which puts the
+    bucket into debt and delays the following callers until it is paid back
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, amount: float = 1) -> float:
+        """Block until `amount` tokens are available and take them
+
+        Returns the number of seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def consume(self, amount: float):
+        """Take `amount` tokens without waiting, possibly going into debt"""
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+
+
+# Passed as a limit to WippGovernor.configure (or Wipp) to lift the current one
+UNLIMITED = "unlimited"
+
+
+class WippGovernor:
+    """Rate limits and concurrency cap shared by all requests to a WIPP host
+
+    Use WippGovernor.for_host() to get the instance shared by every client
+    in the process talking to the same host
+    """
+
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        bytes_per_second: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes = 0
+        self.throttled_seconds = 0.0
+        self.queued_seconds = 0.0
+        self.requests_per_second = None
+        self.bytes_per_second = None
+        self.max_in_flight = None
+        self._request_bucket = None
+        self._bytes_bucket = None
+        self._semaphore = None
+        self.configure(requests_per_second, bytes_per_second, max_in_flight)
+
+    @classmethod
+    def for_host(cls, host: str, **limits) -> "WippGovernor":
+        """Get the governor shared by all clients of a host
+
+        Keyword arguments:
+        host -- network location of the WIPP API (such as "wipp.url.com:8080")
+        limits -- requests_per_second, bytes_per_second and/or max_in_flight
+        (see configure)
+        """
+        with cls._registry_lock:
+            governor = cls._registry.get(host)
+            if governor is None:
+                governor = cls._registry[host] = cls()
+        governor.configure(**limits)
+        return governor
+
+    def configure(
+        self,
+        requests_per_second: Union[float, str, None] = None,
+        bytes_per_second: Union[float, str, None] = None,
+        max_in_flight: Union[int, str, None] = None,
+    ):
+        """Change the given limits, limits left as None keep their current value
+        and UNLIMITED lifts a limit"""
+        with self._lock:
+            if requests_per_second is not None:
+                if requests_per_second == UNLIMITED:
+                    requests_per_second = None
+                self.requests_per_second = requests_per_second
+                self._request_bucket = (
+                    _TokenBucket(requests_per_second) if requests_per_second else None
+                )
+            if bytes_per_second is not None:
+                if bytes_per_second == UNLIMITED:
+                    bytes_per_second = None
+                self.bytes_per_second = bytes_per_second
+                self._bytes_bucket = (
+                    _TokenBucket(bytes_per_second) if bytes_per_second else None
+                )
+            if max_in_flight is not None:
+                if max_in_flight == UNLIMITED:
+                    max_in_flight = None
+                self.max_in_flight = max_in_flight
+                self._semaphore = (
+                    threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+                )
+
+    @contextmanager
+    def slot(self):
+        """Wait for the rate limits and a free in-flight slot for one request"""
+        throttled = 0.0
+        if self._request_bucket is not None:
+            throttled += self._request_bucket.acquire(1)
+        if self._bytes_bucket is not None:
+            # Wait until bytes transferred by previous requests are paid back
+            throttled += self._bytes_bucket.acquire(0)
+
+        semaphore = self._semaphore
+        queued = 0.0
+        if semaphore is not None:
+            start = time.monotonic()
+            semaphore.acquire()
+            queued = time.monotonic() - start
+
+        with self._lock:
+            self.requests += 1
+            self.throttled_seconds += throttled
+            self.queued_seconds += queued
+        try:
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def record_bytes(self, n: int):
+        """Account bytes transferred by a finished request"""
+        if self._bytes_bucket is not None:
+            self._bytes_bucket.consume(n)
+        with self._lock:
+            self.bytes += n
+
+    def throttle_bytes(self, n: int):
+        """Account bytes read from a streamed body, then wait until the byte rate
+        allows reading more (streamed bodies are read without holding a slot)"""
+        self.record_bytes(n)
+        bucket = self._bytes_bucket
+        if bucket is not None:
+            throttled = bucket.acquire(0)
+            with self._lock:
+                self.throttled_seconds += throttled
+
+    @property
+    def stats(self) -> dict:
+        """Counters of requests, bytes and time spent waiting on the limits"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "bytes": self.bytes,
+                "throttled_seconds": self.throttled_seconds,
+                "queued_seconds": self.queued_seconds,
+            }
+
+
+class WippTransferStats:
+    """Counters of bytes sent and received by a client, on the wire and decoded"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sent_bytes = 0
+        self.sent_wire_bytes = 0
+        self.received_bytes = 0
+        self.received_wire_bytes = 0
+
+    def record(self, sent: int, sent_wire: int, received: int, received_wire: int):
+        with self._lock:
+            self.sent_bytes += sent
+            self.sent_wire_bytes += sent_wire
+            self.received_bytes += received
+            self.received_wire_bytes += received_wire
+
+    @property
+    def stats(self) -> dict:
+        """Byte counters and the number of bytes saved by compression"""
+        with self._lock:
+            return {
+                "sent_bytes": self.sent_bytes,
+                "sent_wire_bytes": self.sent_wire_bytes,
+                "received_bytes": self.received_bytes,
+                "received_wire_bytes": self.received_wire_bytes,
+                "saved_bytes": self.sent_bytes
+                - self.sent_wire_bytes
+                + self.received_bytes
+                - self.received_wire_bytes,
+            }
+
+
+class WippProfile:
+    """Wall and CPU time spent in each phase of the requests made within
+    Wipp.profile(), per endpoint
+
+    Phases are "url" (build_request_url), "network" (sending the request and
+    reading the response, including the wait for the client rate limits),
+    "decode" (JSON decoding), "model" (entity construction) and "flatten"
+    (joining pages in get_entities). CPU time is measured per thread, so it
+    stays exact with parallel requests, whose wall times add up to more than
+    the elapsed time of the block.
+    """
+
+    PHASES = ("url", "network", "decode", "model", "flatten")
+
+    def __init__(self, api_path: str = "", cprofile: bool = False):
+        self._lock = threading.Lock()
+        self._api_path = api_path.rstrip("/")
+        self._endpoints = {}
+        # (endpoint, phase) -> [calls, wall, cpu]
+        self.timings = {}
+        # Wall and (process) CPU time of the whole block, set when it exits
+        self.elapsed = None
+        self.cpu = None
+        # cProfile profiler of the thread which entered the block
+        self.profiler = cProfile.Profile() if cprofile else None
+
+    def endpoint(self, location: str) -> str:
+        """Endpoint template of a URL or path (such as "imagesCollections/{id}")"""
+        endpoint = self._endpoints.get(location)
+        if endpoint is None:
+            path = urlparse(location).path
+            if self._api_path and path.startswith(self._api_path + "/"):
+                path = path[len(self._api_path) :]
+            parts = [part for part in path.split("/") if part]
+            # Ids follow plurals, except in Spring Data REST searches
+            if "search" not in parts[:2]:
+                parts = ["{id}" if i % 2 else part for i, part in enumerate(parts)]
+            endpoint = self._endpoints[location] = "/".join(parts)
+        return endpoint
+
+    def record(self, phase: str, location: str, wall: float, cpu: float):
+        endpoint = self.endpoint(location)
+        with self._lock:
+            timing = self.timings.setdefault((endpoint, phase), [0, 0.0, 0.0])
+            timing[0] += 1
+            timing[1] += wall
+            timing[2] += cpu
+
+    @property
+    def phases(self) -> Dict[str, dict]:
+        """Calls, wall and CPU time of each phase, over all endpoints"""
+        phases = {phase: {"calls": 0, "wall": 0.0, "cpu": 0.0} for phase in self.PHASES}
+        with self._lock:
+            for (_, phase), (calls, wall, cpu) in self.timings.items():
+                phases[phase]["calls"] += calls
+                phases[phase]["wall"] += wall
+                phases[phase]["cpu"] += cpu
+        return phases
+
+    def summary(self) -> str:
+        """Table of the time per endpoint and phase, slowest first"""
+        with self._lock:
+            rows = sorted(self.timings.items(), key=lambda item: -item[1][1])
+        width = max([len(endpoint) for (endpoint, _), _ in rows] + [len("endpoint")])
+        line = "{:<%d}  {:<8}{:>8}{:>12}{:>12}" % width
+        lines = [line.format("endpoint", "phase", "calls", "wall (s)", "cpu (s)")]
+        for (endpoint, phase), (calls, wall, cpu) in rows:
+            lines.append(
+                line.format(endpoint, phase, calls, f"{wall:.4f}", f"{cpu:.4f}")
+            )
+        for phase, timing in self.phases.items():
+            lines.append(
+                line.format(
+                    "total",
+                    phase,
+                    timing["calls"],
+                    f"{timing['wall']:.4f}",
+                    f"{timing['cpu']:.4f}",
+                )
+            )
+        if self.elapsed is not None:
+            lines.append(
+                line.format("block", "", "", f"{self.elapsed:.4f}", f"{self.cpu:.4f}")
+            )
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.summary()
+
+    def dump_stats(self, path: Union[str, os.PathLike]):
+        """Write the cProfile statistics (readable with pstats or snakeviz)"""
+        if self.profiler is None:
+            raise ValueError("Profile was not started with cprofile=True")
+        self.profiler.dump_stats(os.fspath(path))
+
+    def dump_collapsed(self, path: Union[str, os.PathLike]):
+        """Write the wall time per endpoint and phase as collapsed stacks (in
+        microseconds), the input format of flamegraph.pl and speedscope"""
+        with self._lock, open(path, "w") as f:
+            for (endpoint, phase), (_, wall, _) in self.timings.items():
+                f.write(f"{endpoint};{phase} {round(wall * 1e6)}\n")
+
+
+# Profile of the requests made in the current context (see Wipp.profile)
+_current_profile = contextvars.ContextVar("wipp_profile", default=None)
+
+
+class _ProfilePhase:
+    """Time a phase into the current WippProfile, if any (a no-op otherwise)"""
+
+    __slots__ = ("profile", "phase", "location", "wall", "cpu")
+
+    def __init__(self, phase: str, location: str = ""):
+        self.profile = _current_profile.get()
+        self.phase = phase
+        self.location = location
+
+    def __enter__(self):
+        if self.profile is not None:
+            self.wall = time.perf_counter()
+            self.cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc):
+        if self.profile is not None:
+            self.profile.record(
+                self.phase,
+                self.location,
+                time.perf_counter() - self.wall,
+                time.thread_time() - self.cpu,
+            )
+
+
+class _LRUByteCache:
+    """Thread-safe LRU cache of bytes values holding at most `max_bytes` in total"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[bytes]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._items[key] = value
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+
+# One global position line of a stitching vector, such as
+# file: img_r001_c001.ome.tif; corr: 0.89; position: (0, 1024); grid: (0, 1);
+_STITCHING_POSITION = re.compile(
+    rb"file: *([^;]*); *corr: *([^;]*); *"
+    rb"position: *\((-?\d+), *(-?\d+)\); *grid: *\((-?\d+), *(-?\d+)\)"
+)
+
+
+def _parse_stitching_positions(text: bytes) -> Dict[str, Any]:
+    """Parse stitching vector lines into a dict of NumPy arrays"""
+    matches = _STITCHING_POSITION.findall(text)
+    files, corr, x, y, grid_x, grid_y = zip(*matches) if matches else ([],) * 6
+    count = len(matches)
+    return {
+        "file": np.array(files, dtype=bytes).astype(str),
+        "corr": np.fromiter(map(float, corr), np.float64, count),
+        "x": np.fromiter(map(int, x), np.int64, count),
+        "y": np.fromiter(map(int, y), np.int64, count),
+        "grid_x": np.fromiter(map(int, grid_x), np.int64, count),
+        "grid_y": np.fromiter(map(int, grid_y), np.int64, count),
+    }
+
+
+def _iter_text_lines(chunks: Iterator[bytes], encoding: str = "utf-8") -> Iterator[str]:
+    """Decode byte chunks into lines, keeping line endings (as csv.reader expects)"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        # Only "\n" ends lines, str.splitlines would also split values on
+        # characters such as "\x0c" or "\u2028"
+        lines = pending.split("\n")
+        # The last line might continue in the next chunk
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _literal_part(pattern: str) -> str:
+    """Longest run of literal characters of a glob pattern"""
+    pattern = re.sub(r"\[[^\]]*\]", "*", pattern)
+    return max(re.split(r"[*?]", pattern), key=len)
+
+
+def _bounded_map(
+    executor: ThreadPoolExecutor, fn: Callable, items, limit: int
+) -> Iterator[Any]:
+    """Like executor.map, but consumes `items` lazily with at most `limit` calls
+    submitted at a time, so memory stays bounded for long inputs"""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class _TokenRefresher:
+    """Keep authorization headers from a Keycloak token provider fresh
+
+    The provider returns a token, a (token, expires_in) tuple or a Keycloak token
+    response dict (with "access_token" and "expires_in"). Tokens are refreshed in
+    the background `margin` seconds before they expire, so requests do not wait
+    for them. Callers needing a new token right away share a single provider call.
+    """
+
+    def __init__(self, provider: Callable, margin: float = 30.0):
+        self.provider = provider
+        self.margin = margin
+        self._headers = None
+        self._expires_at = None
+        self._lock = threading.Lock()
+        self._background = threading.Lock()
+
+    def headers(self) -> dict:
+        """Current authorization headers, refreshing the token if needed"""
+        headers, expires_at = self._headers, self._expires_at
+        now = time.monotonic()
+        if headers is None or (expires_at is not None and now >= expires_at):
+            return self.refresh(headers)
+        if expires_at is not None and now >= expires_at - self.margin:
+            self._refresh_in_background(headers)
+        return headers
+
+    def refresh(self, stale: Optional[dict] = None) -> dict:
+        """Get headers with a new token, unless another thread already replaced
+        the `stale` headers while this one was waiting"""
+        stale_authorization = (stale or {}).get("Authorization")
+        with self._lock:
+            current = self._headers
+            if current is not None and current["Authorization"] != stale_authorization:
+                return current
+
+            token = self.provider()
+            expires_in = None
+            if isinstance(token, dict):
+                token, expires_in = token["access_token"], token.get("expires_in")
+            elif isinstance(token, tuple):
+                token, expires_in = token
+            self._expires_at = (
+                time.monotonic() + expires_in if expires_in is not None else None
+            )
+            self._headers = {"Authorization": f"Bearer {token}"}
+            log.info("Refreshed Keycloak token")
+            return self._headers
+
+    def _refresh_in_background(self, stale: dict):
+        if not self._background.acquire(blocking=False):
+            return
+
+        def run():
+            try:
+                self.refresh(stale)
+            except Exception:
+                log.exception("Keycloak token refresh failed")
+            finally:
+                self._background.release()
+
+        threading.Thread(target=run, daemon=True).start()
+
+
 ###############################################################################
 
 
@@ -48,8 +681,8 @@ class WippAbstractCollection(WippEntity):
     locked: Optional[bool]
     source_job: Optional[str]
     # Only supported in the new version of the API
-    # owner: str
-    # publicly_shared: bool
+    owner: Optional[str]
+    publicly_shared: Optional[bool]
     """Class for holding generic WIPP Collection"""
 
     def __str__(self):
@@ -78,6 +711,7 @@ class WippImageCollection(WippAbstractCollection):
 
 
 class WippImage(WippEntity):
+    id: Optional[str]
     file_name: str
     original_file_name: Optional[str]
     file_size: int
@@ -100,11 +734,12 @@ class WippCsvCollection(WippAbstractCollection):
     """Class for holding generic WIPP Collection"""
 
     def __iter__(self):
-        for csv in self.csvs:
-            yield csv
+        for csv_file in self.csvs:
+            yield csv_file
 
 
 class WippCsv(WippEntity):
+    id: Optional[str]
     file_name: str
     original_file_name: Optional[str]
     file_size: int
@@ -152,7 +787,7 @@ class WippPlugin(WippEntity):
     creation_date: Optional[datetime]
     description: str
     id: Optional[str]
-    inputs = list
+    inputs: list
     institution: Optional[str]
     name: str
     outputs: List
@@ -170,8 +805,310 @@ class WippPlugin(WippEntity):
         return str(self)
 
 
+class WippJob(WippEntity):
+    id: Optional[str]
+    name: str
+    status: Optional[str]
+    type: Optional[str]
+    wipp_executable: Optional[str]
+    wipp_workflow: Optional[str]
+    error: Optional[str]
+    creation_date: Optional[datetime]
+    start_time: Optional[datetime]
+    end_time: Optional[datetime]
+    parameters: Optional[dict]
+    output_parameters: Optional[dict]
+    dependencies: Optional[list]
+    """Class for holding WIPP Job"""
+
+    @property
+    def finished(self) -> bool:
+        return self.status in JOB_FINISHED_STATUSES
+
+    def __str__(self):
+        return f"{self.id}\t{self.name}\t{self.status}"
+
+    def __repr__(self):
+        return str(self)
+
+
+# Status given by WippJobWatcher to jobs which could not be read (such as
+# deleted jobs), the reason is kept in their error field
+JOB_UNAVAILABLE = "UNAVAILABLE"
+
+# Job statuses after which a WIPP Job does not change anymore
+JOB_FINISHED_STATUSES = {"SUCCESS", "ERROR", "CANCELLED", JOB_UNAVAILABLE}
+
+
 # TODO: Add more classes describing WIPP entities
 
+# Classes used to parse entities of a plural (WippEntity if not listed)
+_entity_classes = {
+    "imagesCollections": WippImageCollection,
+    "images": WippImage,
+    "csvCollections": WippCsvCollection,
+    "csv": WippCsv,
+    "genericDatas": WippGenericDataCollection,
+    "genericFile": WippGenericDataFile,
+    "plugins": WippPlugin,
+    "jobs": WippJob,
+}
+
+
+def _field_aliases(model: type, fields: List[str]) -> List[str]:
+    """Keys of the given fields in WIPP JSONs"""
+    return [
+        (
+            model.__fields__[name].alias
+            if name in model.__fields__
+            else snake_case_to_lower_camel_case(name)
+        )
+        for name in fields
+    ]
+
+
+class WippLazyEntity:
+    """Lightweight WIPP entity keeping the raw dict of a listing page
+
+    Fields are validated and converted (such as creation_date into a datetime)
+    only when first read, using the field definitions of `model`. Methods and
+    properties of the model work as well, to_model() builds the full model.
+    """
+
+    __slots__ = ("_raw", "_model", "_values")
+
+    def __init__(self, raw: dict, model: type = WippEntity):
+        self._raw = raw
+        self._model = model
+        self._values = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        field = self._model.__fields__.get(name)
+        if field is None:
+            # Methods and properties of the model, then fields it does not declare
+            attribute = getattr(self._model, name, None)
+            if isinstance(attribute, property):
+                return attribute.fget(self)
+            if callable(attribute):
+                return attribute.__get__(self)
+            alias = snake_case_to_lower_camel_case(name)
+            if alias in self._raw:
+                return self._raw[alias]
+            raise AttributeError(f"{self._model.__name__} has no attribute {name}")
+
+        raw = self._raw.get(field.alias, self._raw.get(name))
+        if raw is None:
+            value = field.get_default()
+        else:
+            value, errors = field.validate(raw, {}, loc=name, cls=self._model)
+            if errors:
+                raise ValidationError([errors], self._model)
+        self._values[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        if name in self.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            self._values[name] = value
+
+    def __getstate__(self):
+        return self._raw, self._model
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @property
+    def raw(self) -> dict:
+        """The dict of the entity as returned by WIPP API"""
+        return self._raw
+
+    def to_model(self) -> WippEntity:
+        """Validate all fields into the full pydantic model"""
+        return self._model(**{**self._raw, **self._values})
+
+    def dict(self, **kwargs) -> dict:
+        return self.to_model().dict(**kwargs)
+
+    def json(self, **kwargs) -> str:
+        return self.to_model().json(**kwargs)
+
+    def __eq__(self, other):
+        if isinstance(other, WippLazyEntity):
+            return self._model is other._model and self._raw == other._raw
+        return NotImplemented
+
+    def __str__(self):
+        # Entities print as their model does, if it defines __str__
+        for cls in self._model.__mro__:
+            if cls is WippEntity:
+                break
+            if "__str__" in vars(cls):
+                return cls.__str__(self)
+        return f"{self._model.__name__}({self._raw})"
+
+    def __repr__(self):
+        return str(self)
+
+
+class WippSyncPlan(BaseModel):
+    """Class for holding the plan (and outcome) of a directory to collection sync"""
+
+    collection_id: str
+    directory: str
+    # Local file names which are missing remotely or differ from the remote copy
+    to_upload: List[str] = []
+    to_replace: List[str] = []
+    # Remote images without a local counterpart
+    to_delete: List[WippImage] = []
+    unchanged: int = 0
+    # File name -> error message for operations which failed
+    errors: Dict[str, str] = {}
+
+    def __str__(self):
+        lines = [f"Sync {self.directory} -> imagesCollections/{self.collection_id}"]
+        lines += [f"+ {name}" for name in self.to_upload]
+        lines += [f"~ {name}" for name in self.to_replace]
+        lines += [f"- {image.file_name}" for image in self.to_delete]
+        lines.append(
+            f"{len(self.to_upload)} to upload, {len(self.to_replace)} to replace, "
+            f"{len(self.to_delete)} to delete, {self.unchanged} unchanged"
+        )
+        lines += [f"! {name}: {error}" for name, error in self.errors.items()]
+        return "\n".join(lines)
+
+
+# Size fields summed by the storage report, per collection plural
+STORAGE_REPORT_FIELDS = {
+    "imagesCollections": ["images_total_size", "metadata_files_total_size"],
+    "csvCollections": ["csv_total_size"],
+    "genericDatas": ["file_total_size"],
+}
+
+
+class WippStorageReport(BaseModel):
+    """Class for holding storage usage totals of WIPP collections"""
+
+    # Collection attribute the totals are grouped by (None for a single total)
+    group_by: Optional[str]
+    # Group -> size field (or "collections" for their number) -> total
+    totals: Dict[str, Dict[str, int]] = {}
+    pages_done: int = 0
+    pages_total: int = 0
+    # Plural (or "<plural> page <n>") -> reason, for listings which failed
+    errors: Dict[str, str] = {}
+
+    @property
+    def complete(self) -> bool:
+        return self.pages_done == self.pages_total and not self.errors
+
+    @property
+    def columns(self) -> List[str]:
+        return ["collections"] + [
+            field for fields in STORAGE_REPORT_FIELDS.values() for field in fields
+        ]
+
+    def add(self, collection: WippAbstractCollection, plural: str):
+        """Add the sizes of a collection to the totals of its group"""
+        group = str(getattr(collection, self.group_by)) if self.group_by else "all"
+        totals = self.totals.setdefault(group, dict.fromkeys(self.columns, 0))
+        totals["collections"] += 1
+        for field in STORAGE_REPORT_FIELDS[plural]:
+            totals[field] += getattr(collection, field) or 0
+
+    def to_csv(self, path: Union[str, os.PathLike]):
+        """Write the totals to a CSV file, one row per group"""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow([self.group_by or "group"] + self.columns + ["total_size"])
+            for group, totals in sorted(self.totals.items()):
+                row = [totals[column] for column in self.columns]
+                writer.writerow([group] + row + [sum(row[1:])])
+
+    def to_json(self, path: Union[str, os.PathLike]):
+        """Write the report to a JSON file"""
+        with open(path, "w") as f:
+            f.write(self.json())
+
+    def __str__(self):
+        lines = ["\t".join([self.group_by or "group"] + self.columns)]
+        for group, totals in sorted(self.totals.items()):
+            lines.append("\t".join([group] + [str(totals[c]) for c in self.columns]))
+        for source, error in sorted(self.errors.items()):
+            lines.append(f"{source}\tfailed\t{error}")
+        return "\n".join(lines)
+
+
+class WippPurgeResult(BaseModel):
+    """Class for holding the outcome of purging one WIPP entity"""
+
+    plural: str
+    id: str
+    name: Optional[str]
+    creation_date: Optional[datetime]
+    # None on a dry run, otherwise whether the entity was deleted
+    deleted: Optional[bool]
+    error: Optional[str]
+
+    def __str__(self):
+        state = {None: "matched", True: "deleted", False: "failed"}[self.deleted]
+        line = f"{self.plural}\t{self.id}\t{self.name}\t{state}"
+        return line + f"\t{self.error}" if self.error else line
+
+    def __repr__(self):
+        return str(self)
+
+
+class WippPluginRegistration(BaseModel):
+    """Class for holding the outcome of registering one WIPP Plugin manifest"""
+
+    path: str
+    name: Optional[str]
+    version: Optional[str]
+    # One of "created", "exists", "duplicate" (of another manifest), "invalid",
+    # "failed", or "new" on a dry run
+    status: str
+    id: Optional[str]
+    error: Optional[str]
+
+    def __str__(self):
+        line = f"{self.path}\t{self.name}\t{self.version}\t{self.status}"
+        return line + f"\t{self.error}" if self.error else line
+
+    def __repr__(self):
+        return str(self)
+
+
+class WippImportStatus(BaseModel):
+    """Class for holding the import outcome of a WIPP Image or CSV Collection"""
+
+    collection_id: str
+    collection: Optional[WippAbstractCollection]
+    # False if the import was still running when the timeout expired, or if
+    # the collection could not be read
+    settled: bool
+    number_of_import_errors: int = 0
+    # File name -> import error, for files which failed to import
+    import_errors: Dict[str, str] = {}
+    # Why the collection could not be read (such as "HTTP 404")
+    error: Optional[str]
+
+    def __str__(self):
+        if self.error:
+            return f"{self.collection_id}\tfailed\t{self.error}"
+        state = "settled" if self.settled else "importing"
+        return f"{self.collection_id}\t{state}\t{self.number_of_import_errors} errors"
+
+    def __repr__(self):
+        return str(self)
+
 
 # Exception classes
 class MissingEnvironmentVariable(Exception):
@@ -179,7 +1116,7 @@ class MissingEnvironmentVariable(Exception):
 
 
 class WippAuthenticationError(Exception):
-    def __init__(self, message, errors):
+    def __init__(self, message="Authentication failed", errors=None):
         super().__init__(message)
         log.error(
             "Authentication failed. Please provide a valid Keycloak token. If you have a Keycloak token, you might need to renew it"
@@ -187,23 +1124,79 @@ class WippAuthenticationError(Exception):
 
 
 class WippForbiddenError(Exception):
-    def __init__(self, message, errors):
+    def __init__(self, message="Forbidden", errors=None):
         super().__init__(message)
         log.error("You are not authorized to access this resource")
 
 
 class WippNotFoundError(Exception):
-    def __init__(self, message, errors):
+    def __init__(self, message="Not found", errors=None):
         super().__init__(message)
         log.error("The requested resource was not found")
 
 
+class WippTimeoutError(TimeoutError):
+    def __init__(self, message="WIPP API request timed out", errors=None):
+        super().__init__(message)
+
+
+# Responses meaning an entity is gone for good, other failures may be transient
+_GONE_STATUS_CODES = (404, 410)
+
+# Request failures which may not happen again (timeouts and connection errors)
+_TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, WippTimeoutError)
+if httpx is not None:
+    _TRANSIENT_ERRORS += (httpx.TransportError,)
+
+
+def _is_transient(e: Exception) -> bool:
+    """Whether a failed request is worth retrying, which it is not once the
+    deadline of the current context is over"""
+    deadline = _current_deadline.get()
+    if deadline is not None and deadline.expired:
+        return False
+    return isinstance(e, _TRANSIENT_ERRORS)
+
+
 class Wipp:
     """Class for interfacing with WIPP API"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        coalesce_requests: bool = True,
+        requests_per_second: Union[float, str, None] = None,
+        bytes_per_second: Union[float, str, None] = None,
+        max_in_flight: Union[int, str, None] = None,
+        compress_requests_min_size: Optional[int] = None,
+        http2: bool = False,
+        http2_prior_knowledge: bool = False,
+        token_provider: Optional[Callable] = None,
+        token_refresh_margin: float = 30.0,
+        timeout: Optional[Tuple[float, float]] = (10.0, 120.0),
+    ):
         """WIPP client class constructor
-        Constructor does not take any arguments directly, but rather reads them from environment variables
+        WIPP API URL is not taken directly, but rather read from environment variables
+
+        Keyword arguments:
+        coalesce_requests -- share a single crawl between concurrent identical listings
+        requests_per_second -- limit of requests per second to the WIPP host
+        bytes_per_second -- limit of transferred bytes per second to the WIPP host
+        max_in_flight -- maximum number of concurrent requests to the WIPP host
+        compress_requests_min_size -- gzip JSON request bodies of at least this many
+        bytes (the server has to accept Content-Encoding: gzip), None disables it
+        http2 -- multiplex requests over a single HTTP/2 connection (requires
+        httpx[http2]). HTTP/2 is negotiated with TLS, so only https URLs use it
+        and servers without HTTP/2 support are talked to over HTTP/1.1
+        http2_prior_knowledge -- speak HTTP/2 over plain http URLs without
+        negotiation (h2c), for servers known to support it
+        token_provider -- callable returning Keycloak tokens (see set_token_provider)
+        token_refresh_margin -- seconds before expiry at which tokens are refreshed
+        timeout -- (connect, read) timeouts of every request in seconds, None
+        waits forever (see also deadline() for a budget across many requests)
+
+        Limits are shared by all clients of the same host in the process
+        (see WippGovernor), limits left as None keep their current value and
+        UNLIMITED lifts a limit set by another client
         """
 
         try:
@@ -218,12 +1211,56 @@ class Wipp:
         except:
             raise ValueError("WIPP API URL is not valid")
 
+        # Authorization headers for Keycloak
+        self._auth_headers = None
+        self._tokens = None
+        if token_provider is not None:
+            self.set_token_provider(token_provider, token_refresh_margin)
+
+        # Pooled connections and limits shared by every request of the client
+        self.http2 = http2 and httpx is not None
+        if http2 and not self.http2:
+            log.warning("HTTP/2 requires httpx[http2], falling back to HTTP/1.1")
+        if self.http2:
+            # httpx clients are thread-safe and negotiate the same content codings
+            # as urllib3 on their own
+            plaintext = self.parsed_api_route.scheme == "http"
+            if plaintext and not http2_prior_knowledge:
+                log.warning(
+                    "HTTP/2 is only negotiated over https, requests to "
+                    f"{self.api_route} use HTTP/1.1 (see http2_prior_knowledge)"
+                )
+            self._http2_client = httpx.Client(
+                http2=True, http1=not (plaintext and http2_prior_knowledge)
+            )
+            self._http2_client.cookies.jar.set_policy(_REJECT_COOKIES)
+        else:
+            # Every thread gets its own requests.Session (which is not thread-safe),
+            # all of them reuse the connections of a single urllib3 pool
+            self._adapter = HTTPAdapter(
+                pool_maxsize=max(
+                    DEFAULT_POOLSIZE,
+                    max_in_flight if isinstance(max_in_flight, int) else 0,
+                )
+            )
+            self._local = threading.local()
+        self.timeout = timeout
+        self.compress_requests_min_size = compress_requests_min_size
+        self.transfer = WippTransferStats()
+        self.governor = WippGovernor.for_host(
+            self.parsed_api_route.netloc,
+            requests_per_second=requests_per_second,
+            bytes_per_second=bytes_per_second,
+            max_in_flight=max_in_flight,
+        )
+
         api_is_live = self.check_api_is_live()
         if api_is_live["code"] != 200:
             raise Exception(api_is_live["data"])
 
-        # Authorization headers for Keycloak
-        self._auth_headers = None
+        # Concurrent identical listings are served by a single crawl
+        self.coalesce_requests = coalesce_requests
+        self._single_flight = _SingleFlight()
 
     def __str__(self):
         return f"WIPP API @ {self.api_route}"
@@ -233,12 +1270,293 @@ class Wipp:
 
     @property
     def auth_headers(self):
+        if self._tokens is not None:
+            return self._tokens.headers()
         return self._auth_headers
 
     @auth_headers.setter
     def auth_headers(self, keycloak_token):
+        # A static token replaces the token provider
+        self._tokens = None
         self._auth_headers = {"Authorization": f"Bearer {keycloak_token}"}
 
+    def set_token_provider(self, token_provider: Callable, margin: float = 30.0):
+        """Get Keycloak tokens from a provider and refresh them automatically
+
+        Tokens are refreshed in the background shortly before they expire, and a
+        request rejected with 401 is retried once with a new token. Concurrent
+        requests share a single refresh.
+
+        Keyword arguments:
+        token_provider -- callable returning a token, a (token, expires_in) tuple
+        or a Keycloak token response (such as KeycloakOpenID.token() results)
+        margin -- seconds before expiry at which tokens are refreshed
+        """
+        self._tokens = _TokenRefresher(token_provider, margin)
+
+    def with_token(self, keycloak_token: Optional[str]) -> "Wipp":
+        """Get a client authenticated with another Keycloak token
+
+        The new client shares connections, limits, statistics and in-flight
+        listings with this one and only differs in its authorization headers.
+        Multi-threaded services should create one per request (or user) instead
+        of setting auth_headers on a client shared between threads.
+
+        Keyword arguments:
+        keycloak_token -- token of the user, None for anonymous requests
+        """
+        client = copy.copy(self)
+        client._tokens = None
+        if keycloak_token is None:
+            client._auth_headers = None
+        else:
+            client.auth_headers = keycloak_token
+        return client
+
+    @contextmanager
+    def deadline(self, seconds: float, partial: bool = False):
+        """Limit the total time of all requests made within the block
+
+        The deadline applies to retries and to pages or items fetched in parallel.
+        Requests are given at most the remaining time as their timeouts, and once
+        it is over WippTimeoutError is raised. Nested deadlines can only shorten
+        the enclosing one.
+
+        Keyword arguments:
+        seconds -- time budget of the block
+        partial -- make get_entities (and the listing methods using it) return
+        the entities fetched so far instead of raising, setting partial_result
+        on the yielded WippDeadline
+        """
+        deadline = WippDeadline(seconds, partial)
+        enclosing = _current_deadline.get()
+        if enclosing is not None:
+            deadline.expires_at = min(deadline.expires_at, enclosing.expires_at)
+        token = _current_deadline.set(deadline)
+        try:
+            yield deadline
+        finally:
+            _current_deadline.reset(token)
+
+    @contextmanager
+    def profile(self, cprofile: bool = False):
+        """Measure the time spent in each client phase by the calls within the block
+
+        Yields a WippProfile, print it for a summary table once the block exits.
+        Requests made by worker threads of the client are included.
+
+        Keyword arguments:
+        cprofile -- also run cProfile on the calling thread (see
+        WippProfile.dump_stats)
+        """
+        profile = WippProfile(self.parsed_api_route.path, cprofile)
+        token = _current_profile.set(profile)
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profile.profiler is not None:
+            profile.profiler.enable()
+        try:
+            yield profile
+        finally:
+            if profile.profiler is not None:
+                profile.profiler.disable()
+            profile.elapsed = time.perf_counter() - wall
+            profile.cpu = time.process_time() - cpu
+            _current_profile.reset(token)
+
+    def _timeout(self, timeout=None):
+        """Request timeout, limited by the remaining time of the current deadline"""
+        if timeout is None:
+            timeout = self.timeout
+        deadline = _current_deadline.get()
+        if deadline is None:
+            return timeout
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise WippTimeoutError("WIPP API deadline exceeded")
+        if timeout is None:
+            return (remaining, remaining)
+        if not isinstance(timeout, tuple):
+            timeout = (timeout, timeout)
+        return tuple(min(t, remaining) for t in timeout)
+
+    @property
+    def _session(self):
+        """HTTP client of the current thread"""
+        if self.http2:
+            return self._http2_client
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.cookies.set_policy(_REJECT_COOKIES)
+            session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.session = session
+        return session
+
+    def close(self):
+        """Close all pooled connections of the client (and its with_token copies)"""
+        if self.http2:
+            self._http2_client.close()
+        else:
+            self._adapter.close()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request to WIPP API through the client's governor
+
+        With the HTTP/2 transport an httpx.Response is returned, which offers the
+        same status_code, headers, content, text and json() interface
+        """
+        kwargs.setdefault("headers", self.auth_headers)
+        r = self._send(method, url, **kwargs)
+        if r.status_code == 401 and self._tokens is not None:
+            # The token expired or was revoked while in flight, retry once
+            kwargs["headers"] = self._refreshed_headers(kwargs["headers"])
+            r = self._send(method, url, **kwargs)
+        return r
+
+    def _refreshed_headers(self, headers: Optional[dict]) -> dict:
+        """Replace the authorization of rejected request headers with a new token"""
+        return {**(headers or {}), **self._tokens.refresh(headers)}
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Encode the body and send a request with the client's transport"""
+        sent = None
+        if (
+            kwargs.get("json") is not None
+            and self.compress_requests_min_size is not None
+        ):
+            body = json.dumps(kwargs.pop("json")).encode("utf-8")
+            sent = len(body)
+            headers = {**(kwargs["headers"] or {}), "Content-Type": "application/json"}
+            if sent >= self.compress_requests_min_size:
+                body = gzip.compress(body)
+                headers["Content-Encoding"] = "gzip"
+            kwargs["data"] = body
+            kwargs["headers"] = headers
+
+        if self.http2:
+            return self._request_http2(method, url, sent, **kwargs)
+
+        with _ProfilePhase("network", url), self.governor.slot():
+            kwargs["timeout"] = self._timeout(kwargs.get("timeout"))
+            try:
+                r = self._session.request(method, url, **kwargs)
+            except requests.exceptions.Timeout as e:
+                raise WippTimeoutError(str(e))
+
+        sent_wire = len(r.request.body or b"")
+        received = len(r.content)
+        # Bytes read from the socket, before Content-Encoding is decoded
+        tell = getattr(r.raw, "tell", None)
+        received_wire = tell() if tell is not None else received
+        self._record_transfer(sent, sent_wire, received, received_wire)
+        return r
+
+    def _request_http2(self, method: str, url: str, sent: Optional[int], **kwargs):
+        """Send a request over the httpx HTTP/2 connection"""
+        if isinstance(kwargs.get("data"), bytes):
+            kwargs["content"] = kwargs.pop("data")
+
+        with _ProfilePhase("network", url), self.governor.slot():
+            kwargs["timeout"] = _httpx_timeout(self._timeout(kwargs.get("timeout")))
+            try:
+                r = self._session.request(method, url, **kwargs)
+            except httpx.TimeoutException as e:
+                raise WippTimeoutError(str(e))
+
+        sent_wire = int(r.request.headers.get("Content-Length", 0))
+        received = len(r.content)
+        received_wire = r.num_bytes_downloaded
+        self._record_transfer(sent, sent_wire, received, received_wire)
+        return r
+
+    @contextmanager
+    def _stream(self, method: str, url: str, **kwargs):
+        """Send a request to WIPP API and yield the response with its body unread
+
+        The governor slot is only held until the response headers arrive, the
+        body read with _iter_content is throttled by the byte rate limit. Decoded
+        byte counters of streamed responses report the bytes read from the wire.
+        """
+        kwargs.setdefault("headers", self.auth_headers)
+        with self._open_stream(method, url, **kwargs) as r:
+            if r.status_code != 401 or self._tokens is None:
+                yield r
+                return
+        # The token expired or was revoked while in flight, retry once
+        kwargs["headers"] = self._refreshed_headers(kwargs["headers"])
+        with self._open_stream(method, url, **kwargs) as r:
+            yield r
+
+    @contextmanager
+    def _open_stream(self, method: str, url: str, **kwargs):
+        # The slot is released before yielding, user code consuming the body
+        # (possibly making requests itself) never runs while holding it
+        with _ProfilePhase("network", url), self.governor.slot():
+            timeout = self._timeout(kwargs.pop("timeout", None))
+            if self.http2:
+                try:
+                    stream = self._session.stream(
+                        method, url, timeout=_httpx_timeout(timeout), **kwargs
+                    )
+                    r = stream.__enter__()
+                except httpx.TimeoutException as e:
+                    raise WippTimeoutError(str(e))
+            else:
+                try:
+                    r = self._session.request(
+                        method, url, stream=True, timeout=timeout, **kwargs
+                    )
+                except requests.exceptions.Timeout as e:
+                    raise WippTimeoutError(str(e))
+        try:
+            yield r
+        finally:
+            received_wire = _wire_bytes(r)
+            if self.http2:
+                stream.__exit__(None, None, None)
+            else:
+                r.close()
+            # Body bytes were accounted to the governor by _iter_content
+            self.transfer.record(0, 0, received_wire, received_wire)
+
+    def _iter_content(self, r, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the decoded body of a streamed requests or httpx response,
+        within the byte rate limit, stopping with WippTimeoutError when the
+        current deadline expires"""
+        if hasattr(r, "iter_bytes"):
+            chunks = r.iter_bytes(chunk_size)
+        else:
+            chunks = r.iter_content(chunk_size)
+        deadline = _current_deadline.get()
+        url = str(r.url)
+        read = 0
+        while True:
+            with _ProfilePhase("network", url):
+                chunk = next(chunks, None)
+            if chunk is None:
+                return
+            wire = _wire_bytes(r)
+            self.governor.throttle_bytes(wire - read)
+            read = wire
+            if deadline is not None and deadline.expired:
+                raise WippTimeoutError("WIPP API deadline exceeded")
+            yield chunk
+
+    def _record_transfer(
+        self, sent: Optional[int], sent_wire: int, received: int, received_wire: int
+    ):
+        """Account the bytes of a finished request (sent is None if not compressed)"""
+        self.transfer.record(
+            sent if sent is not None else sent_wire, sent_wire, received, received_wire
+        )
+        self.governor.record_bytes(sent_wire + received_wire)
+
+    def _auth_key(self) -> tuple:
+        """Hashable representation of the current authorization headers"""
+        return tuple(sorted((self.auth_headers or {}).items()))
+
     def build_request_url(
         self,
         plural: str,
@@ -254,22 +1572,24 @@ class Wipp:
         path_suffix -- extra path to be added to the request URL (such as "search/findByNameContainingIgnoreCase")
         extra_query -- extra query parameters to be added to the request URL (such as {"name": "test"})
         """
-        parsed_url = self.parsed_api_route
+        with _ProfilePhase("url") as phase:
+            parsed_url = self.parsed_api_route
 
-        parsed_query = parse_qs(parsed_url.query)
-        parsed_query.update(extra_query)
+            parsed_query = parse_qs(parsed_url.query)
+            parsed_query.update(extra_query)
 
-        parsed_url = parsed_url._replace(
-            path=os.path.join(parsed_url.path, path_prefix, plural, path_suffix),
-            query=urlencode(parsed_query, doseq=True),
-        )
+            parsed_url = parsed_url._replace(
+                path=os.path.join(parsed_url.path, path_prefix, plural, path_suffix),
+                query=urlencode(parsed_query, doseq=True),
+            )
 
-        return urlunparse(parsed_url)
+            phase.location = urlunparse(parsed_url)
+        return phase.location
 
     def check_api_is_live(self) -> dict:
         """Check if WIPP API is live"""
         try:
-            r = requests.get(self.api_route, timeout=1)
+            r = self._request("GET", self.api_route, timeout=1)
         except:
             return {
                 "code": 500,
@@ -292,12 +1612,11 @@ class Wipp:
     ) -> tuple:
 
         """Get tuple with WIPP entities' number of pages and page size"""
-        r = requests.get(
-            self.build_request_url(plural, path_prefix, path_suffix, extra_query),
-            headers=self._auth_headers,
-        )
+        url = self.build_request_url(plural, path_prefix, path_suffix, extra_query)
+        r = self._request("GET", url)
         if r.status_code == 200:
-            response = r.json()
+            with _ProfilePhase("decode", url):
+                response = r.json()
             total_pages = response["page"]["totalPages"]
             page_size = response["page"]["size"]
 
@@ -310,19 +1629,22 @@ class Wipp:
         path_prefix: Union[str, bytes, os.PathLike] = "",
         path_suffix: Union[str, bytes, os.PathLike] = "",
         extra_query: dict = {},
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> list[WippEntity]:
         """Get the page of WIPP Collections
 
         Keyword arguments:
         index -- page index starting from 0
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep, others are dropped from the page
+        as soon as it is decoded (implies lazy, since required fields may be left out)
         """
 
-        r = requests.get(
-            self.build_request_url(
-                plural, path_prefix, path_suffix, {"page": index} | extra_query
-            ),
-            headers=self._auth_headers,
+        url = self.build_request_url(
+            plural, path_prefix, path_suffix, {"page": index} | extra_query
         )
+        r = self._request("GET", url)
         if r.status_code == 200:
 
             # Fix for inconsistent plural names in CSV
@@ -334,25 +1656,30 @@ class Wipp:
             elif plural == "genericFile":
                 key = "genericFiles"
 
-            entities_page = r.json()["_embedded"][key]
+            with _ProfilePhase("decode", url):
+                entities_page = r.json()["_embedded"][key]
 
             # Parse into the base or child class (if implemented for the entity)
-            if plural == "imagesCollections":
-                return [WippImageCollection(**entity) for entity in entities_page]
-            elif plural == "images":
-                return [WippImage(**entity) for entity in entities_page]
-            elif plural == "csvCollections":
-                return [WippCsvCollection(**entity) for entity in entities_page]
-            elif plural == "csv":
-                return [WippCsv(**entity) for entity in entities_page]
-            elif plural == "genericDatas":
-                return [WippGenericDataCollection(**entity) for entity in entities_page]
-            elif plural == "genericFile":
-                return [WippGenericDataFile(**entity) for entity in entities_page]
-            elif plural == "plugins":
-                return [WippPlugin(**entity) for entity in entities_page]
-            else:
-                return [WippEntity(**entity) for entity in entities_page]
+            entity_class = _entity_classes.get(plural, WippEntity)
+            with _ProfilePhase("model", url):
+                if fields is not None:
+                    aliases = _field_aliases(entity_class, fields)
+                    return [
+                        WippLazyEntity(
+                            {
+                                alias: entity[alias]
+                                for alias in aliases
+                                if alias in entity
+                            },
+                            entity_class,
+                        )
+                        for entity in entities_page
+                    ]
+                if lazy:
+                    return [
+                        WippLazyEntity(entity, entity_class) for entity in entities_page
+                    ]
+                return [entity_class(**entity) for entity in entities_page]
 
     def get_entities_all_pages(
         self,
@@ -360,6 +1687,8 @@ class Wipp:
         path_prefix: Union[str, bytes, os.PathLike] = "",
         path_suffix: Union[str, bytes, os.PathLike] = "",
         extra_query: dict = {},
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> list[list[WippEntity]]:
         """Get list of all pages of WIPP Image Collections"""
 
@@ -367,28 +1696,220 @@ class Wipp:
             plural, path_prefix, path_suffix, extra_query
         )
         return [
-            self.get_entities_page(plural, page, path_prefix, path_suffix, extra_query)
+            self.get_entities_page(
+                plural, page, path_prefix, path_suffix, extra_query, lazy, fields
+            )
             for page in range(total_pages)
         ]
 
-    def get_entities(
+    def iter_entities_pages(
         self,
         plural: str,
         path_prefix: Union[str, bytes, os.PathLike] = "",
         path_suffix: Union[str, bytes, os.PathLike] = "",
         extra_query: dict = {},
-    ) -> list[WippEntity]:
-        """Get list of all available WIPP entities"""
+        prefetch: int = 0,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[list[WippEntity]]:
+        """Iterate over pages of WIPP entities, fetching them on demand
 
-        return [
-            entity
-            for entity in sum(
-                self.get_entities_all_pages(
-                    plural, path_prefix, path_suffix, extra_query
-                ),
-                [],
+        Keyword arguments:
+        prefetch -- number of pages fetched in the background while the current
+        page is being processed (0 fetches each page only when it is requested)
+        lazy -- yield WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities_page)
+        """
+
+        total_pages, _ = self.get_entities_summary(
+            plural, path_prefix, path_suffix, extra_query
+        )
+
+        if prefetch <= 0:
+            for page in range(total_pages):
+                yield self.get_entities_page(
+                    plural, page, path_prefix, path_suffix, extra_query, lazy, fields
+                )
+            return
+
+        # At most `prefetch` pages are buffered or in flight at any time
+        with _ContextThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending = deque()
+            next_page = 0
+
+            def fill():
+                nonlocal next_page
+                while next_page < total_pages and len(pending) < prefetch:
+                    pending.append(
+                        executor.submit(
+                            self.get_entities_page,
+                            plural,
+                            next_page,
+                            path_prefix,
+                            path_suffix,
+                            extra_query,
+                            lazy,
+                            fields,
+                        )
+                    )
+                    next_page += 1
+
+            try:
+                fill()
+                while pending:
+                    page = pending.popleft().result()
+                    fill()
+                    yield page
+            finally:
+                # Consumer stopped early, do not fetch pages nobody will read
+                for future in pending:
+                    future.cancel()
+
+    def iter_entities(
+        self,
+        plural: str,
+        path_prefix: Union[str, bytes, os.PathLike] = "",
+        path_suffix: Union[str, bytes, os.PathLike] = "",
+        extra_query: dict = {},
+        prefetch: int = 0,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[WippEntity]:
+        """Iterate over all available WIPP entities, page by page
+
+        Keyword arguments:
+        prefetch -- number of pages fetched in the background ahead of the consumer
+        lazy -- yield WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a Spring Data REST projection defined by the server
+        (implies lazy, see get_entities)
+        """
+        if projection is not None:
+            extra_query = {**extra_query, "projection": projection}
+            lazy = True
+        for page in self.iter_entities_pages(
+            plural, path_prefix, path_suffix, extra_query, prefetch, lazy, fields
+        ):
+            yield from page
+
+    def get_entities(
+        self,
+        plural: str,
+        path_prefix: Union[str, bytes, os.PathLike] = "",
+        path_suffix: Union[str, bytes, os.PathLike] = "",
+        extra_query: dict = {},
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
+        """Get list of all available WIPP entities
+
+        Concurrent calls for the same URL and credentials share a single crawl
+        (unless the client was created with coalesce_requests=False or the call
+        is made within a deadline)
+
+        Keyword arguments:
+        lazy -- return WippLazyEntity objects, which keep the raw page dicts and
+        convert fields only when they are read (much cheaper for large listings)
+        fields -- names of the fields to keep (such as ["name", "version"]), other
+        fields are dropped from every page as soon as it is decoded and
+        WippLazyEntity objects are returned
+        projection -- name of a Spring Data REST projection defined by the server,
+        which makes the server leave out fields before sending the pages
+        (WippLazyEntity objects are returned, since required fields may be left
+        out)
+
+        fields only trims the pages once they are received, since WIPP does not
+        define projections for its entities. Deployments which define one can pass
+        its name as projection to also save the transfer, fields then selects among
+        the fields of the projection. The get_* and search_* listing methods
+        accept both.
+        """
+
+        if projection is not None:
+            extra_query = {**extra_query, "projection": projection}
+            lazy = True
+
+        # A shared crawl would run under the deadline (and partial results) of
+        # whichever caller started it, so calls with deadlines crawl on their own
+        if not self.coalesce_requests or _current_deadline.get() is not None:
+            return self._get_entities(
+                plural, path_prefix, path_suffix, extra_query, lazy, fields
             )
-        ]
+
+        key = (
+            self.build_request_url(plural, path_prefix, path_suffix, extra_query),
+            self._auth_key(),
+            lazy,
+            tuple(fields) if fields is not None else None,
+        )
+        # Every caller gets its own list, entities themselves are shared
+        return list(
+            self._single_flight.do(
+                key,
+                self._get_entities,
+                plural,
+                path_prefix,
+                path_suffix,
+                extra_query,
+                lazy,
+                fields,
+            )
+        )
+
+    def _get_entities(
+        self,
+        plural: str,
+        path_prefix: Union[str, bytes, os.PathLike] = "",
+        path_suffix: Union[str, bytes, os.PathLike] = "",
+        extra_query: dict = {},
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+    ) -> list[WippEntity]:
+        deadline = _current_deadline.get()
+        if deadline is not None and deadline.partial:
+            pages = []
+            try:
+                for page in self.iter_entities_pages(
+                    plural, path_prefix, path_suffix, extra_query, 0, lazy, fields
+                ):
+                    pages.append(page)
+            except WippTimeoutError:
+                log.warning(f"Deadline exceeded, returning {len(pages)} pages")
+                deadline.partial_result = True
+            return sum(pages, [])
+
+        pages = self.get_entities_all_pages(
+            plural, path_prefix, path_suffix, extra_query, lazy, fields
+        )
+        with _ProfilePhase("flatten", os.path.join(path_prefix, plural, path_suffix)):
+            return [entity for entity in sum(pages, [])]
+
+    def snapshot_entities(
+        self,
+        plural: str,
+        path: Union[str, os.PathLike, None] = None,
+        path_prefix: Union[str, bytes, os.PathLike] = "",
+        path_suffix: Union[str, bytes, os.PathLike] = "",
+        extra_query: dict = {},
+        prefetch: int = 2,
+    ) -> "WippSnapshot":
+        """Get all available WIPP entities as a columnar snapshot (see
+        WippSnapshot), to share a listing with multiprocessing workers
+
+        Keyword arguments:
+        path -- file to write the snapshot to, None for shared memory (which
+        must be freed with unlink())
+        prefetch -- number of pages fetched in the background while reading
+        """
+        entities = self.iter_entities(
+            plural, path_prefix, path_suffix, extra_query, prefetch, lazy=True
+        )
+        model = _entity_classes.get(plural, WippEntity)
+        if path is None:
+            return WippSnapshot.to_shared_memory(entities, model)
+        return WippSnapshot.write(entities, path, model)
 
     def create_entity(
         self,
@@ -404,36 +1925,21 @@ class Wipp:
         entity -- the entity object to be created
         """
 
-        r = requests.post(
+        r = self._request(
+            "POST",
             self.build_request_url(plural, path_prefix, path_suffix, extra_query),
-            headers=self._auth_headers,
             json=entity.dict(by_alias=True),
         )
         if r.status_code == 201:
             entity = r.json()
             log.info(f"Created {plural}: {entity['name']}")
-            if plural == "imagesCollections":
-                return WippImageCollection(**entity)
-            elif plural == "images":
-                return WippImage(**entity)
-            elif plural == "csvCollections":
-                return WippCsvCollection(**entity)
-            elif plural == "csv":
-                return WippCsv(**entity)
-            elif plural == "genericDatas":
-                return WippGenericDataCollection(**entity)
-            elif plural == "genericFile":
-                return WippGenericDataFile(**entity)
-            elif plural == "plugins":
-                return WippPlugin(**entity)
-            else:
-                return WippEntity(**entity)
+            return _entity_classes.get(plural, WippEntity)(**entity)
         elif r.status_code == 401:
-            raise WippAuthenticationError()
+            raise WippAuthenticationError(r.text, r)
         elif r.status_code == 403:
-            raise WippForbiddenError()
+            raise WippForbiddenError(r.text, r)
         elif r.status_code == 404:
-            raise WippNotFoundError()
+            raise WippNotFoundError(r.text, r)
         else:
             log.error(r)
             log.error(r.text)
@@ -445,236 +1951,571 @@ class Wipp:
         entity_id: str,
         path_prefix: Union[str, bytes, os.PathLike] = "",
         extra_query: dict = {},
-    ) -> None:
-        r = requests.delete(
+    ) -> bool:
+        """Delete a WIPP entity, returns whether it was deleted
+
+        Keyword arguments:
+        entity_id -- id of the entity to delete
+        """
+        r = self._request(
+            "DELETE",
             self.build_request_url(plural, path_prefix, entity_id, extra_query),
-            headers=self._auth_headers,
         )
         if r.status_code == 200 or r.status_code == 204:
             log.info(f"Deleted {plural} {entity_id}")
-            return None
+            return True
+        log.error(r)
+        log.error(r.text)
+        return False
+
+    def upload_file(
+        self,
+        plural: str,
+        path: Union[str, os.PathLike],
+        path_prefix: Union[str, bytes, os.PathLike] = "",
+        chunk_size: int = 1024 * 1024,
+    ) -> bool:
+        """Upload a file to a WIPP collection with the flow.js chunked protocol
+
+        Keyword arguments:
+        plural -- upload endpoint of the collection (such as "upload")
+        path -- local path of the file to upload
+        path_prefix -- path of the collection (such as "imagesCollections/<id>")
+        chunk_size -- size of uploaded chunks in bytes, the last chunk also
+        holds the remainder of the file (as in flow.js)
+        """
+        file_name = os.path.basename(path)
+        total_size = os.path.getsize(path)
+        total_chunks = max(total_size // chunk_size, 1)
+        identifier = f"{total_size}-{re.sub(r'[^0-9a-zA-Z_-]', '', file_name)}"
+        url = self.build_request_url(plural, path_prefix)
+
+        with open(path, "rb") as f:
+            for number in range(1, total_chunks + 1):
+                chunk = f.read(chunk_size if number < total_chunks else -1)
+                r = self._request(
+                    "POST",
+                    url,
+                    data={
+                        "flowChunkNumber": number,
+                        "flowChunkSize": chunk_size,
+                        "flowCurrentChunkSize": len(chunk),
+                        "flowTotalSize": total_size,
+                        "flowIdentifier": identifier,
+                        "flowFilename": file_name,
+                        "flowRelativePath": file_name,
+                        "flowTotalChunks": total_chunks,
+                    },
+                    files={"file": (file_name, chunk)},
+                )
+                if r.status_code not in (200, 201):
+                    log.error(r)
+                    log.error(r.text)
+                    return False
+
+        log.info(f"Uploaded {file_name} to {path_prefix}")
+        return True
+
+    def get_entity(
+        self,
+        plural: str,
+        entity_id: str,
+        path_prefix: Union[str, bytes, os.PathLike] = "",
+        extra_query: dict = {},
+    ) -> WippEntity:
+        """Get a single WIPP entity by its id
+
+        Keyword arguments:
+        entity_id -- id of the entity to get
+        """
+        url = self.build_request_url(plural, path_prefix, entity_id, extra_query)
+        r = self._request("GET", url)
+        if r.status_code == 200:
+            with _ProfilePhase("decode", url):
+                entity = r.json()
+            with _ProfilePhase("model", url):
+                return _entity_classes.get(plural, WippEntity)(**entity)
 
     ### Query methods
     # Specialized methods for entities
-    def get_csv_collections(self) -> list[WippCsvCollection]:
+    def get_csv_collections(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippCsvCollection]:
         """Get list of all available WIPP Csv Collection objects"""
-        return self.get_entities("csvCollections")
+        return self.get_entities(
+            "csvCollections", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_generic_datas(self) -> list[WippGenericDataCollection]:
+    def get_generic_datas(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippGenericDataCollection]:
         """Get list of all available WIPP Generic Data objects"""
-        return self.get_entities("genericDatas")
+        return self.get_entities(
+            "genericDatas", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_image_collections(self) -> list[WippImageCollection]:
+    def get_image_collections(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippImageCollection]:
         """Get list of all available WIPP Image Collection objects"""
-        return self.get_entities("imagesCollections")
+        return self.get_entities(
+            "imagesCollections", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_jobs(self) -> list[WippEntity]:
+    def get_jobs(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippJob]:
         """Get list of all available WIPP Job objects"""
-        return self.get_entities("jobs")
+        return self.get_entities(
+            "jobs", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_notebooks(self) -> list[WippEntity]:
+    def get_notebooks(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all available WIPP Notebook objects"""
-        return self.get_entities("notebooks")
+        return self.get_entities(
+            "notebooks", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_plugins(self) -> list[WippPlugin]:
+    def get_plugins(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippPlugin]:
         """Get list of all available WIPP Plugin objects"""
-        return self.get_entities("plugins")
+        return self.get_entities(
+            "plugins", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_pyramid_annotations(self) -> list[WippEntity]:
+    def get_pyramid_annotations(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all available WIPP Pyramid Annotation objects"""
-        return self.get_entities("pyramidAnnotations")
+        return self.get_entities(
+            "pyramidAnnotations", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_pyramids(self) -> list[WippEntity]:
+    def get_pyramids(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all available WIPP Pyramid objects"""
-        return self.get_entities("pyramids")
+        return self.get_entities(
+            "pyramids", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_stitching_vectors(self) -> list[WippEntity]:
+    def get_stitching_vectors(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all available WIPP Stitching Vector objects"""
-        return self.get_entities("stitchingVectors")
+        return self.get_entities(
+            "stitchingVectors", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_tensorboard_logs(self) -> list[WippEntity]:
+    def get_tensorboard_logs(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all available WIPP Tensorboard Log objects"""
-        return self.get_entities("tensorboardLogs")
+        return self.get_entities(
+            "tensorboardLogs", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_tensorflow_models(self) -> list[WippEntity]:
+    def get_tensorflow_models(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all available WIPP Tensorflow Model objects"""
-        return self.get_entities("tensorflowModels")
+        return self.get_entities(
+            "tensorflowModels", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_visualizations(self) -> list[WippEntity]:
+    def get_visualizations(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all available WIPP Visualization objects"""
-        return self.get_entities("visualizations")
+        return self.get_entities(
+            "visualizations", lazy=lazy, fields=fields, projection=projection
+        )
 
-    def get_workflows(self) -> list[WippEntity]:
+    def get_workflows(
+        self,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all available WIPP Workflow objects"""
-        return self.get_entities("workflows")
+        return self.get_entities(
+            "workflows", lazy=lazy, fields=fields, projection=projection
+        )
 
     # Search methods
-    def search_csv_collections(self, name) -> list[WippCsvCollection]:
+    def search_csv_collections(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippCsvCollection]:
         """Get list of all found WIPP CSV Collection objects
 
         Keyword arguments:
         name -- string to search in CSV Collection names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "csvCollections",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_generic_datas(self, name) -> list[WippGenericDataCollection]:
+    def search_generic_datas(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippGenericDataCollection]:
         """Get list of all found WIPP Generic Data objects
 
         Keyword arguments:
         name -- string to search in Generic Data names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "genericDatas",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_image_collections(self, name) -> list[WippImageCollection]:
+    def search_image_collections(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippImageCollection]:
         """Get list of all found WIPP Image Collection objects
 
         Keyword arguments:
         name -- string to search in WIPP Image Collections names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "imagesCollections",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_jobs(self, name) -> list[WippEntity]:
+    def search_jobs(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippJob]:
         """Get list of all found WIPP Job objects
 
         Keyword arguments:
         name -- string to search in WIPP Job names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "jobs",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_notebooks(self, name) -> list[WippEntity]:
+    def search_notebooks(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all found WIPP Notebook objects
 
         Keyword arguments:
         name -- string to search in WIPP Notebook names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "notebooks",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_plugins(self, name) -> list[WippPlugin]:
+    def search_plugins(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippPlugin]:
         """Get list of all found WIPP Plugin objects
 
         Keyword arguments:
         name -- string to search in Csv Collection names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "plugins",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_pyramid_annotations(self, name: str) -> list[WippEntity]:
+    def search_pyramid_annotations(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all found WIPP Pyramid Annotation objects
 
         Keyword arguments:
         name -- string to search in Pyramid Annotations names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "pyramidAnnotations",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_pyramids(self, name: str) -> list[WippEntity]:
+    def search_pyramids(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all found WIPP Pyramid objects
 
         Keyword arguments:
         name -- string to search in Pyramids names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "pyramids",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_pyramids(self, name: str) -> list[WippEntity]:
+    def search_pyramids(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all found WIPP Pyramid objects
 
         Keyword arguments:
         name -- string to search in Pyramids names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "pyramids",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_stitching_vectors(self, name: str) -> list[WippEntity]:
+    def search_stitching_vectors(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all found WIPP Stitching Vector objects
 
         Keyword arguments:
         name -- string to search in Stitching Vectors names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "stitchingVectors",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_tensorboard_logs(self, name: str) -> list[WippEntity]:
+    def search_tensorboard_logs(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all found WIPP Tensorboard Log objects
 
         Keyword arguments:
         name -- string to search in Tensorboard Logs names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "tensorboardLogs",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_tensorflow_models(self, name: str) -> list[WippEntity]:
+    def search_tensorflow_models(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all found WIPP Tensorflow Model objects
 
         Keyword arguments:
         name -- string to search in Tensorflow Models names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "tensorflowModels",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_visualizations(self, name: str) -> list[WippEntity]:
+    def search_visualizations(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all found WIPP Visualization objects
 
         Keyword arguments:
         name -- string to search in Visualizations names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "visualizations",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
-    def search_workflows(self, name: str) -> list[WippEntity]:
+    def search_workflows(
+        self,
+        name: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippEntity]:
         """Get list of all found WIPP Workflow objects
 
         Keyword arguments:
         name -- string to search in Workflows names
+        lazy -- return WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
         """
         return self.get_entities(
             "workflows",
             path_suffix="search/findByNameContainingIgnoreCase",
             extra_query={"name": name},
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
     # Image Collection methods
@@ -696,11 +2537,663 @@ class Wipp:
         """
         self.delete_entity("imagesCollections", image_collection_id)
 
-    def get_image_collections_images(self, collection_id: str) -> list[WippImage]:
+    def get_image_collection(self, image_collection_id: str) -> WippImageCollection:
+        """Get a WIPP Image Collection by its id"""
+        return self.get_entity("imagesCollections", image_collection_id)
+
+    def get_image_collections_images(
+        self,
+        collection_id: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippImage]:
         """Get list of all images in a WIPP Image Collection"""
         return self.get_entities(
-            "images", path_prefix="imagesCollections/" + collection_id
+            "images",
+            path_prefix="imagesCollections/" + collection_id,
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
+        )
+
+    def iter_image_collections_images(
+        self,
+        collection_id: str,
+        prefetch: int = 0,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> Iterator[WippImage]:
+        """Iterate over images in a WIPP Image Collection without loading all pages
+
+        Keyword arguments:
+        collection_id -- WIPP Image Collection id
+        prefetch -- number of pages fetched in the background ahead of the consumer
+        lazy -- yield WippLazyEntity objects, converting fields only when read
+        fields -- names of the fields to keep (see get_entities)
+        projection -- name of a projection defined by the server (see get_entities)
+        """
+        return self.iter_entities(
+            "images",
+            path_prefix="imagesCollections/" + collection_id,
+            prefetch=prefetch,
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
+        )
+
+    def upload_image(self, collection_id: str, path: Union[str, os.PathLike]) -> bool:
+        """Upload an image file to a WIPP Image Collection
+
+        Keyword arguments:
+        collection_id -- WIPP Image Collection id
+        path -- local path of the image file
+        """
+        return self.upload_file(
+            "upload", path, path_prefix="imagesCollections/" + collection_id
+        )
+
+    def delete_image(self, collection_id: str, image_id: str) -> bool:
+        """Delete an image from a WIPP Image Collection
+
+        Keyword arguments:
+        collection_id -- WIPP Image Collection id
+        image_id -- WIPP Image id to delete
+        """
+        return self.delete_entity(
+            "images", image_id, path_prefix="imagesCollections/" + collection_id
+        )
+
+    def download_image(
+        self,
+        collection_id: str,
+        image: WippImage,
+        directory: Union[str, os.PathLike],
+        chunk_size: int = 1024 * 1024,
+    ) -> Optional[str]:
+        """Download an image of a WIPP Image Collection into a local directory
+
+        Returns the path of the downloaded file, None if the download failed.
+        Only the last component of the file name sent by WIPP is used, so images
+        are always written into `directory`.
+
+        Keyword arguments:
+        collection_id -- WIPP Image Collection id
+        image -- WippImage object of the image to download
+        directory -- local directory to write the file to
+        chunk_size -- bytes downloaded and written at a time
+        """
+        file_name = os.path.basename(image.file_name.replace("\\", "/"))
+        if file_name in ("", ".", ".."):
+            log.error(f"Invalid file name {image.file_name!r} of image {image.id}")
+            return None
+        url = self.build_request_url(
+            "download", f"imagesCollections/{collection_id}/images/{image.id}"
+        )
+        path = os.path.join(directory, file_name)
+        with self._stream("GET", url) as r:
+            if r.status_code != 200:
+                log.error(r)
+                return None
+            # Write next to the final path so an interrupted download leaves no file
+            tmp_path = path + ".part"
+            try:
+                with open(tmp_path, "wb") as f:
+                    for chunk in self._iter_content(r, chunk_size):
+                        f.write(chunk)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        os.replace(tmp_path, path)
+        return path
+
+    def sync_image_collection(
+        self,
+        collection_id: str,
+        directory: Union[str, os.PathLike],
+        pattern: str = "*",
+        delete_extra: bool = False,
+        dry_run: bool = False,
+        workers: int = 4,
+    ) -> WippSyncPlan:
+        """Mirror a local directory into a WIPP Image Collection
+
+        Only files missing from the collection or with a different size are
+        uploaded. Images converted by WIPP on import (where file_name differs from
+        original_file_name) are matched by their original name only, since their
+        size can not be compared with the local file.
+
+        Keyword arguments:
+        collection_id -- WIPP Image Collection id
+        directory -- local directory with the images (not searched recursively)
+        pattern -- glob pattern selecting local files (such as "*.ome.tif")
+        delete_extra -- delete remote images which are not present locally
+        dry_run -- only compute and log the plan, without changing the collection
+        workers -- number of concurrent uploads and deletions
+        """
+        remote = {}
+        for image in self.iter_image_collections_images(collection_id, prefetch=2):
+            remote[image.original_file_name or image.file_name] = image
+
+        plan = WippSyncPlan(collection_id=collection_id, directory=str(directory))
+        local = set()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or not fnmatch.fnmatch(entry.name, pattern):
+                    continue
+                local.add(entry.name)
+                image = remote.get(entry.name)
+                if image is None:
+                    plan.to_upload.append(entry.name)
+                elif (
+                    image.file_name == entry.name
+                    and image.file_size != entry.stat().st_size
+                ):
+                    plan.to_replace.append(entry.name)
+                else:
+                    plan.unchanged += 1
+
+        if delete_extra:
+            plan.to_delete = [
+                image for name, image in remote.items() if name not in local
+            ]
+
+        if dry_run:
+            log.info(plan)
+            return plan
+
+        to_replace = set(plan.to_replace)
+
+        def upload(name):
+            # Uploading next to an image which could not be deleted would
+            # leave both copies in the collection
+            if name in to_replace and not self.delete_image(
+                collection_id, remote[name].id
+            ):
+                raise RuntimeError("could not delete the previous image")
+            return self.upload_image(collection_id, os.path.join(directory, name))
+
+        def delete(image):
+            return self.delete_image(collection_id, image.id)
+
+        with _ContextThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(upload, name): name
+                for name in plan.to_upload + plan.to_replace
+            }
+            futures.update(
+                {
+                    executor.submit(delete, image): image.file_name
+                    for image in plan.to_delete
+                }
+            )
+            for future, name in futures.items():
+                try:
+                    if not future.result():
+                        plan.errors[name] = "request failed"
+                except Exception as e:
+                    plan.errors[name] = str(e)
+
+        log.info(plan)
+        return plan
+
+    # Storage report methods
+    def iter_storage_report(
+        self, group_by: Optional[str] = None, workers: int = 8
+    ) -> Iterator[WippStorageReport]:
+        """Compute storage usage of all image, CSV and generic data collections,
+        yielding the partial report every time a page of collections arrives
+
+        Pages of all collection plurals are requested concurrently. The last
+        report yielded covers all collections, unless listings failed, which are
+        then recorded in its errors (and complete is False).
+
+        Keyword arguments:
+        group_by -- collection attribute to group totals by (such as "owner" or
+        "source_job"), None for a single total
+        workers -- number of concurrent page requests
+        """
+        report = WippStorageReport(group_by=group_by)
+
+        def summary(plural):
+            try:
+                return self.get_entities_summary(plural) or "request failed"
+            except Exception as e:
+                return str(e)
+
+        with _ContextThreadPoolExecutor(max_workers=workers) as executor:
+            summaries = dict(
+                zip(
+                    STORAGE_REPORT_FIELDS,
+                    executor.map(summary, STORAGE_REPORT_FIELDS),
+                )
+            )
+            for plural, result in summaries.items():
+                if isinstance(result, str):
+                    log.error(f"Could not list {plural}: {result}")
+                    report.errors[plural] = result
+            futures = {
+                executor.submit(self.get_entities_page, plural, page): (plural, page)
+                for plural, result in summaries.items()
+                if not isinstance(result, str)
+                for page in range(result[0])
+            }
+            report.pages_total = len(futures)
+            if report.errors or not futures:
+                yield report.copy(deep=True)
+            for future in as_completed(futures):
+                plural, page = futures[future]
+                try:
+                    collections = future.result()
+                except Exception as e:
+                    collections, error = None, str(e)
+                else:
+                    error = "request failed"
+                if collections is None:
+                    log.error(f"Could not list {plural} page {page}: {error}")
+                    report.errors[f"{plural} page {page}"] = error
+                for collection in collections or []:
+                    report.add(collection, plural)
+                report.pages_done += 1
+                yield report.copy(deep=True)
+
+    def get_storage_report(
+        self, group_by: Optional[str] = None, workers: int = 8
+    ) -> WippStorageReport:
+        """Get storage usage of all image, CSV and generic data collections
+
+        Keyword arguments:
+        group_by -- collection attribute to group totals by (such as "owner" or
+        "source_job"), None for a single total
+        workers -- number of concurrent page requests
+        """
+        report = WippStorageReport(group_by=group_by)
+        for report in self.iter_storage_report(group_by, workers):
+            pass
+        return report
+
+    # Purge methods
+    def iter_purge(
+        self,
+        plural: str,
+        name_pattern: Optional[str] = None,
+        older_than: Union[timedelta, datetime, None] = None,
+        dry_run: bool = False,
+        workers: int = 8,
+    ) -> Iterator[WippPurgeResult]:
+        """Delete all WIPP entities matching a name pattern and/or age, yielding
+        the result for each entity as its deletion completes
+
+        The longest literal part of name_pattern is searched on the server, and
+        results are streamed and filtered locally. All matches are collected
+        before deleting, so deletions do not shift the pages being read.
+        Deletions run concurrently, within the client rate limits.
+
+        Keyword arguments:
+        plural -- entity plural (such as "imagesCollections")
+        name_pattern -- case sensitive glob pattern of names (such as "test-*")
+        older_than -- only match entities created before this datetime, or more
+        than this timedelta ago (naive datetimes are taken as UTC)
+        dry_run -- only report the matches, without deleting them
+        workers -- number of concurrent deletions
+        """
+        if name_pattern is None and older_than is None:
+            raise ValueError("name_pattern or older_than is required to purge")
+        if isinstance(older_than, timedelta):
+            older_than = datetime.now(timezone.utc) - older_than
+        if older_than is not None and older_than.tzinfo is None:
+            older_than = older_than.replace(tzinfo=timezone.utc)
+
+        def matches(result: WippPurgeResult) -> bool:
+            if name_pattern is not None and not fnmatch.fnmatchcase(
+                result.name or "", name_pattern
+            ):
+                return False
+            if older_than is not None:
+                created = result.creation_date
+                if created is None:
+                    return False
+                if created.tzinfo is None:
+                    created = created.replace(tzinfo=timezone.utc)
+                return created < older_than
+            return True
+
+        literal = _literal_part(name_pattern) if name_pattern else ""
+        if literal:
+            entities = self.iter_entities(
+                plural,
+                path_suffix="search/findByNameContainingIgnoreCase",
+                extra_query={"name": literal},
+                prefetch=2,
+                lazy=True,
+            )
+        else:
+            entities = self.iter_entities(plural, prefetch=2, lazy=True)
+        # Dates of entities without a model are parsed by WippPurgeResult
+        results = (
+            WippPurgeResult(
+                plural=plural,
+                id=entity.id,
+                name=getattr(entity, "name", None),
+                creation_date=getattr(entity, "creation_date", None),
+            )
+            for entity in entities
+        )
+        matched = [result for result in results if matches(result)]
+        log.info(f"Matched {len(matched)} {plural} to purge")
+
+        if dry_run:
+            yield from matched
+            return
+
+        def delete(result):
+            try:
+                result.deleted = self.delete_entity(plural, result.id)
+                if not result.deleted:
+                    result.error = "request failed"
+            except Exception as e:
+                result.deleted = False
+                result.error = str(e)
+            return result
+
+        with _ContextThreadPoolExecutor(max_workers=workers) as executor:
+            yield from _bounded_map(executor, delete, matched, 2 * workers)
+
+    def purge(
+        self,
+        plural: str,
+        name_pattern: Optional[str] = None,
+        older_than: Union[timedelta, datetime, None] = None,
+        dry_run: bool = False,
+        workers: int = 8,
+    ) -> List[WippPurgeResult]:
+        """Delete all WIPP entities matching a name pattern and/or age (see
+        iter_purge), returns the result for each matched entity"""
+        return list(self.iter_purge(plural, name_pattern, older_than, dry_run, workers))
+
+    # Import tracking methods
+    def iter_import_results(
+        self,
+        collection_ids: List[str],
+        plural: str = "imagesCollections",
+        timeout: Optional[float] = None,
+        interval: float = 1.0,
+        max_interval: float = 30.0,
+        workers: int = 8,
+    ) -> Iterator[WippImportStatus]:
+        """Poll WIPP collections until their imports settle, yielding each one as
+        soon as it has no more files importing
+
+        Collections which did not change since the previous poll are polled less
+        often (doubling the interval up to max_interval), collections making
+        progress go back to the base interval. Polls send If-None-Match with the
+        last ETag, so unchanged collections cost a 304 when the server supports it.
+
+        Collections which do not exist (404 or 410, such as unknown ids) are
+        yielded at once with settled=False and the reason in error. Other failed
+        polls (such as 429, 5xx, timeouts or connection errors) count as polls
+        without change, so the collection is polled again until the timeout.
+
+        Keyword arguments:
+        collection_ids -- ids of the collections to wait for
+        plural -- "imagesCollections" or "csvCollections"
+        timeout -- seconds after which collections still importing are yielded
+        with settled=False (None waits forever)
+        interval -- base polling interval in seconds
+        max_interval -- longest polling interval in seconds
+        workers -- number of concurrent polls
+        """
+        if plural == "csvCollections":
+            importing_field, files_plural = "number_importing_csv", "csv"
+        else:
+            importing_field, files_plural = "number_importing_images", "images"
+
+        start = time.monotonic()
+        deadline = start + timeout if timeout is not None else None
+        pending = {
+            collection_id: {
+                "etag": None,
+                "collection": None,
+                "error": None,
+                "interval": interval,
+                "next": start,
+            }
+            for collection_id in collection_ids
+        }
+
+        def poll(collection_id):
+            state = pending[collection_id]
+            headers = dict(self.auth_headers or {})
+            if state["etag"] is not None:
+                headers["If-None-Match"] = state["etag"]
+            try:
+                r = self._request(
+                    "GET",
+                    self.build_request_url(plural, "", collection_id),
+                    headers=headers,
+                )
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                log.warning(f"Polling {plural} {collection_id} failed: {e}")
+                return False
+            if r.status_code == 304:
+                return False
+            if r.status_code in _GONE_STATUS_CODES:
+                # Such as an unknown collection, which would never settle
+                log.error(r)
+                log.error(r.text)
+                state["error"] = f"HTTP {r.status_code}"
+                return False
+            if r.status_code != 200:
+                # Such as 429 or 503, polled again (less often) until the timeout
+                log.warning(f"Polling {plural} {collection_id} failed: {r}")
+                return False
+            state["etag"] = r.headers.get("ETag")
+            collection = _entity_classes[plural](**r.json())
+            changed = state["collection"] != collection
+            state["collection"] = collection
+            return changed
+
+        def result(collection_id, settled):
+            state = pending.pop(collection_id)
+            if state["error"] is not None:
+                return WippImportStatus(
+                    collection_id=collection_id, settled=False, error=state["error"]
+                )
+            collection = state["collection"]
+            errors = getattr(collection, "number_of_import_errors", None) or 0
+            import_errors = {}
+            if errors:
+                import_errors = {
+                    f.file_name: f.import_error
+                    for f in self.iter_entities(
+                        files_plural, path_prefix=f"{plural}/{collection_id}"
+                    )
+                    if f.import_error
+                }
+            return WippImportStatus(
+                collection_id=collection_id,
+                collection=collection,
+                settled=settled,
+                number_of_import_errors=errors,
+                import_errors=import_errors,
+            )
+
+        with _ContextThreadPoolExecutor(max_workers=workers) as executor:
+            while pending:
+                now = time.monotonic()
+                due = [cid for cid, state in pending.items() if state["next"] <= now]
+                for collection_id, changed in zip(due, executor.map(poll, due)):
+                    state = pending[collection_id]
+                    collection = state["collection"]
+                    if state["error"] is not None or (
+                        collection is not None
+                        and not getattr(collection, importing_field)
+                    ):
+                        yield result(collection_id, True)
+                        continue
+                    state["interval"] = (
+                        interval
+                        if changed
+                        else min(state["interval"] * 2, max_interval)
+                    )
+                    state["next"] = now + state["interval"]
+
+                if not pending:
+                    break
+
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    log.warning(f"{len(pending)} {plural} still importing")
+                    for collection_id in list(pending):
+                        yield result(collection_id, False)
+                    break
+
+                wake = min(state["next"] for state in pending.values())
+                if deadline is not None:
+                    wake = min(wake, deadline)
+                time.sleep(max(wake - now, 0))
+
+    def wait_for_import(
+        self,
+        collection_ids: List[str],
+        plural: str = "imagesCollections",
+        timeout: Optional[float] = None,
+        interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Dict[str, WippImportStatus]:
+        """Wait until WIPP collections have no more files importing
+
+        Returns the import status of every collection by its id, see
+        iter_import_results for the polling strategy
+
+        Keyword arguments:
+        collection_ids -- ids of the collections to wait for
+        plural -- "imagesCollections" or "csvCollections"
+        timeout -- seconds to wait at most (None waits forever)
+        """
+        return {
+            status.collection_id: status
+            for status in self.iter_import_results(
+                collection_ids, plural, timeout, interval, max_interval
+            )
+        }
+
+    # Job methods
+    def get_job(self, job_id: str) -> WippJob:
+        """Get a WIPP Job by its id"""
+        return self.get_entity("jobs", job_id)
+
+    def get_workflow_jobs(self, workflow_id: str) -> Optional[List[WippJob]]:
+        """Get all WIPP Jobs of a workflow with a single request, None on failure
+
+        Keyword arguments:
+        workflow_id -- WIPP Workflow id
+        """
+        url = self.build_request_url(
+            "jobs",
+            path_suffix="search/findByWippWorkflow",
+            extra_query={"wippWorkflow": workflow_id, "size": 10000},
         )
+        r = self._request("GET", url)
+        if r.status_code != 200:
+            log.error(r)
+            log.error(r.text)
+            return None
+        return [WippJob(**job) for job in r.json()["_embedded"]["jobs"]]
+
+    def watch_jobs(
+        self,
+        job_ids: List[str],
+        on_change: Optional[Callable[[WippJob, Optional[str]], None]] = None,
+        interval: float = 2.0,
+        max_interval: float = 60.0,
+        workers: int = 8,
+    ) -> "WippJobWatcher":
+        """Create a watcher following the status of many WIPP Jobs
+
+        Keyword arguments:
+        job_ids -- ids of the jobs to follow
+        on_change -- called with the job and its previous status on every change
+        interval -- base polling interval in seconds
+        max_interval -- longest polling interval in seconds
+        workers -- number of concurrent job requests
+        """
+        return WippJobWatcher(self, job_ids, on_change, interval, max_interval, workers)
+
+    # Pyramid methods
+    def open_pyramid(self, pyramid_id: str, **options) -> "WippPyramidTiles":
+        """Get an accessor fetching and caching tiles of a WIPP Pyramid
+
+        Keyword arguments:
+        pyramid_id -- WIPP Pyramid id
+        options -- passed to WippPyramidTiles (timeslice, tile_size, format,
+        cache_bytes, cache_dir, workers, tile_path)
+        """
+        return WippPyramidTiles(self, pyramid_id, **options)
+
+    # Stitching Vector methods
+    def iter_stitching_vector(
+        self,
+        stitching_vector_id: str,
+        timeslice: Union[int, str] = 1,
+        chunk_size: int = 1024 * 1024,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the global positions of a WIPP Stitching Vector timeslice as
+        batches of NumPy arrays (requires numpy)
+
+        Every batch is a dict of equally long arrays: "file" (str), "corr"
+        (float64), "x", "y", "grid_x" and "grid_y" (int64), holding the lines
+        parsed from one downloaded chunk.
+
+        Keyword arguments:
+        stitching_vector_id -- WIPP Stitching Vector id
+        timeslice -- timeslice of the stitching vector
+        chunk_size -- bytes downloaded and parsed at a time
+        """
+        if np is None:
+            raise ImportError(
+                "NumPy is required to parse stitching vectors, "
+                "install it with `pip install wipp_client[numpy]`"
+            )
+
+        url = self.build_request_url(
+            "globalPositions",
+            f"stitchingVectors/{stitching_vector_id}/timeslices/{timeslice}",
+        )
+        with self._stream("GET", url) as r:
+            if r.status_code != 200:
+                log.error(r)
+                return
+            remainder = b""
+            for chunk in self._iter_content(r, chunk_size):
+                # Only complete lines are parsed, the rest waits for the next chunk
+                chunk = remainder + chunk
+                end = chunk.rfind(b"\n") + 1
+                remainder = chunk[end:]
+                if end:
+                    with _ProfilePhase("decode", url):
+                        positions = _parse_stitching_positions(chunk[:end])
+                    yield positions
+            if remainder.strip():
+                with _ProfilePhase("decode", url):
+                    positions = _parse_stitching_positions(remainder)
+                yield positions
+
+    def get_stitching_vector_positions(
+        self, stitching_vector_id: str, timeslice: Union[int, str] = 1
+    ) -> Dict[str, Any]:
+        """Get the global positions of a WIPP Stitching Vector timeslice as a dict
+        of NumPy arrays (see iter_stitching_vector for the columns)"""
+        batches = list(self.iter_stitching_vector(stitching_vector_id, timeslice))
+        if not batches:
+            return _parse_stitching_positions(b"")
+        return {
+            column: np.concatenate([batch[column] for batch in batches])
+            for column in batches[0]
+        }
 
     # CSV Collection methods
     def create_csv_collection(self, csv_collection: WippCsvCollection):
@@ -719,9 +3212,158 @@ class Wipp:
         """
         self.delete_entity("csvCollections", csv_collection_id)
 
-    def get_csv_collections_csv_files(self, collection_id: str) -> list[WippCsv]:
+    def get_csv_collection(self, csv_collection_id: str) -> WippCsvCollection:
+        """Get a WIPP CSV Collection by its id"""
+        return self.get_entity("csvCollections", csv_collection_id)
+
+    def get_csv_collections_csv_files(
+        self,
+        collection_id: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippCsv]:
         """Get list of all CSV files in a WIPP CSV Collection"""
-        return self.get_entities("csv", path_prefix="csvCollections/" + collection_id)
+        return self.get_entities(
+            "csv",
+            path_prefix="csvCollections/" + collection_id,
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
+        )
+
+    def iter_csv_file(
+        self,
+        collection_id: str,
+        csv_file: WippCsv,
+        batch_size: int = 10000,
+        columns: Optional[List[str]] = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> Iterator[Dict[str, List[str]]]:
+        """Stream the contents of a CSV file of a WIPP CSV Collection in row batches
+
+        Every batch maps column names to lists of at most batch_size values.
+        Values missing from rows shorter than the header are read as "".
+
+        Keyword arguments:
+        collection_id -- WIPP CSV Collection id
+        csv_file -- WippCsv object of the file to read
+        batch_size -- number of rows per batch
+        columns -- names of the columns to keep (all columns if None)
+        chunk_size -- bytes downloaded at a time
+        """
+        url = self.build_request_url(
+            "download", f"csvCollections/{collection_id}/csv/{csv_file.id}"
+        )
+        with self._stream("GET", url) as r:
+            if r.status_code != 200:
+                log.error(r)
+                return
+            reader = csv.reader(_iter_text_lines(self._iter_content(r, chunk_size)))
+            header = next(reader, None)
+            if header is None:
+                return
+            names = header if columns is None else columns
+            missing = [name for name in names if name not in header]
+            if missing:
+                raise ValueError(f"Columns {missing} not in {csv_file.file_name}")
+            indices = [header.index(name) for name in names]
+
+            batch = {name: [] for name in names}
+            rows = 0
+            for row in reader:
+                if not row:
+                    continue
+                for name, index in zip(names, indices):
+                    batch[name].append(row[index] if index < len(row) else "")
+                rows += 1
+                if rows == batch_size:
+                    yield batch
+                    batch = {name: [] for name in names}
+                    rows = 0
+            if rows:
+                yield batch
+
+    def iter_csv_collection(
+        self,
+        collection_id: str,
+        batch_size: int = 10000,
+        columns: Optional[List[str]] = None,
+        workers: int = 4,
+        csv_files: Optional[List[WippCsv]] = None,
+    ) -> Iterator[Tuple[WippCsv, Dict[str, List[str]]]]:
+        """Stream the contents of all CSV files of a WIPP CSV Collection
+
+        Files are read concurrently and their row batches are yielded as
+        (csv_file, batch) pairs in the order they arrive. At most two batches
+        per worker are buffered, so memory does not grow with the collection.
+
+        Keyword arguments:
+        collection_id -- WIPP CSV Collection id
+        batch_size -- number of rows per batch
+        columns -- names of the columns to keep (all columns if None)
+        workers -- number of files read concurrently
+        csv_files -- WippCsv objects to read (all files of the collection if None)
+        """
+        if csv_files is None:
+            csv_files = self.iter_entities(
+                "csv", path_prefix="csvCollections/" + collection_id
+            )
+        files = iter(csv_files)
+        files_lock = threading.Lock()
+        batches = queue.Queue(maxsize=2 * workers)
+        stopped = threading.Event()
+        done = object()
+
+        def put(item):
+            # Give up when the consumer went away instead of blocking forever
+            while not stopped.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def read():
+            try:
+                while not stopped.is_set():
+                    with files_lock:
+                        csv_file = next(files, None)
+                    if csv_file is None:
+                        break
+                    for batch in self.iter_csv_file(
+                        collection_id, csv_file, batch_size, columns
+                    ):
+                        if not put((csv_file, batch)):
+                            return
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        threads = [
+            threading.Thread(
+                target=contextvars.copy_context().run, args=(read,), daemon=True
+            )
+            for _ in range(workers)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            running = workers
+            while running:
+                item = batches.get()
+                if item is done:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stopped.set()
+            for thread in threads:
+                thread.join()
 
     # Generic Data methods
     def create_generic_data_collection(self, generic_data: WippGenericDataCollection):
@@ -740,10 +3382,20 @@ class Wipp:
         """
         self.delete_entity("genericDatas", generic_data_id)
 
-    def get_generic_data_files(self, generic_data_id: str) -> list[WippGenericDataFile]:
+    def get_generic_data_files(
+        self,
+        generic_data_id: str,
+        lazy: bool = False,
+        fields: Optional[List[str]] = None,
+        projection: Optional[str] = None,
+    ) -> list[WippGenericDataFile]:
         """Get list of all files in a WIPP Generic Data"""
         return self.get_entities(
-            "genericFile", path_prefix="genericDatas/" + generic_data_id
+            "genericFile",
+            path_prefix="genericDatas/" + generic_data_id,
+            lazy=lazy,
+            fields=fields,
+            projection=projection,
         )
 
     # Plugin methods
@@ -755,6 +3407,115 @@ class Wipp:
         """
         return self.create_entity("plugins", plugin)
 
+    def iter_register_plugins(
+        self,
+        directory: Union[str, os.PathLike],
+        pattern: str = "*.json",
+        recursive: bool = False,
+        dry_run: bool = False,
+        workers: int = 8,
+    ) -> Iterator[WippPluginRegistration]:
+        """Register all WIPP Plugin manifests of a directory which are not
+        registered yet, yielding the outcome for each manifest
+
+        Manifests are loaded and validated concurrently and compared by
+        (name, version) with an index of existing plugins built from a single
+        listing, so only new plugins are created (concurrently).
+
+        Keyword arguments:
+        directory -- directory with the plugin manifests (JSON files)
+        pattern -- glob pattern of manifest file names
+        recursive -- also search subdirectories (such as one per plugin)
+        dry_run -- only report which manifests would be created
+        workers -- number of concurrent manifest loads and creations
+        """
+        if recursive:
+            paths = glob.glob(os.path.join(directory, "**", pattern), recursive=True)
+        else:
+            paths = glob.glob(os.path.join(directory, pattern))
+
+        def load(path):
+            try:
+                with open(path) as f:
+                    manifest = json.load(f)
+                if not isinstance(manifest, dict):
+                    raise ValueError("manifest is not a JSON object")
+                plugin = WippPlugin(**manifest)
+            except (OSError, ValueError) as e:
+                # ValidationError and JSONDecodeError are both ValueErrors
+                return path, None, str(e)
+            return path, plugin, None
+
+        with _ContextThreadPoolExecutor(max_workers=workers) as executor:
+            index = executor.submit(
+                lambda: {
+                    (plugin.name, plugin.version): plugin.id
+                    for plugin in self.iter_entities(
+                        "plugins", prefetch=2, fields=["id", "name", "version"]
+                    )
+                }
+            )
+            manifests = list(executor.map(load, sorted(paths)))
+            existing = index.result()
+
+        seen = set()
+        to_create = []
+        for path, plugin, error in manifests:
+            if plugin is None:
+                yield WippPluginRegistration(path=path, status="invalid", error=error)
+                continue
+            key = (plugin.name, plugin.version)
+            result = WippPluginRegistration(
+                path=path, name=plugin.name, version=plugin.version, status="new"
+            )
+            if key in existing:
+                result.status = "exists"
+                result.id = existing[key]
+            elif key in seen:
+                result.status = "duplicate"
+            else:
+                seen.add(key)
+                to_create.append((result, plugin))
+                continue
+            yield result
+
+        if dry_run:
+            for result, _ in to_create:
+                yield result
+            return
+
+        def create(item):
+            result, plugin = item
+            try:
+                created = self.create_plugin(plugin)
+            except Exception as e:
+                created = None
+                result.error = str(e)
+            if created is None:
+                result.status = "failed"
+                result.error = result.error or "request failed"
+            else:
+                result.status = "created"
+                result.id = created.id
+            return result
+
+        with _ContextThreadPoolExecutor(max_workers=workers) as executor:
+            yield from _bounded_map(executor, create, to_create, 2 * workers)
+
+    def register_plugins(
+        self,
+        directory: Union[str, os.PathLike],
+        pattern: str = "*.json",
+        recursive: bool = False,
+        dry_run: bool = False,
+        workers: int = 8,
+    ) -> List[WippPluginRegistration]:
+        """Register all new WIPP Plugin manifests of a directory (see
+        iter_register_plugins), returns the outcome for each manifest"""
+        return list(
+            self.iter_register_plugins(directory, pattern, recursive, dry_run, workers)
+        )
+
     def delete_plugin(self, plugin_id: str):
         """Delete a WIPP Plugin
 
@@ -762,3 +3523,582 @@ class Wipp:
         plugin_id -- WIPP Plugin ID to delete
         """
         self.delete_entity("plugins", plugin_id)
+
+
+class WippJobWatcher:
+    """Follow the status of many WIPP Jobs in a single polling loop
+
+    Every round only the jobs which are not finished yet are requested. Jobs of
+    a workflow with several unfinished jobs are refreshed with a single search
+    by workflow, other jobs (and all of them on the first round, before their
+    workflow is known) with one request each. When no job changed during a
+    round, the polling interval doubles (up to max_interval), any change brings
+    it back to the base interval.
+
+    Jobs which do not exist anymore (404 or 410, such as deleted jobs) or can
+    not be parsed are given the JOB_UNAVAILABLE status, with the reason in their
+    error field, and are not polled anymore. Jobs which could not be read for
+    other reasons (such as 429, 5xx, timeouts or connection errors) keep their
+    last known state and are polled again in the next round.
+
+    Iterating over the watcher yields jobs whenever their status changes until all
+    of them are finished, run() does the same while only calling on_change.
+    """
+
+    def __init__(
+        self,
+        client: Wipp,
+        job_ids: List[str],
+        on_change: Optional[Callable[[WippJob, Optional[str]], None]] = None,
+        interval: float = 2.0,
+        max_interval: float = 60.0,
+        workers: int = 8,
+    ):
+        self.client = client
+        self.on_change = on_change
+        self.interval = interval
+        self.max_interval = max_interval
+        self.workers = workers
+        # Latest known state of every job (None until the first poll)
+        self.jobs: Dict[str, Optional[WippJob]] = {job_id: None for job_id in job_ids}
+        self._stopped = threading.Event()
+
+    def add(self, job_id: str):
+        """Start following another job"""
+        self.jobs.setdefault(job_id, None)
+
+    def stop(self):
+        """Stop the polling loop after the current round"""
+        self._stopped.set()
+
+    @property
+    def pending(self) -> List[str]:
+        """Ids of the jobs which are not finished yet"""
+        return [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job is None or not job.finished
+        ]
+
+    def _fetch(self, job_id: str) -> Union[WippJob, str, None]:
+        """Get a job, the reason why it can not be read, or None if reading it
+        failed for a reason which may go away"""
+        client = self.client
+        try:
+            r = client._request("GET", client.build_request_url("jobs", "", job_id))
+            if r.status_code == 200:
+                return WippJob(**r.json())
+        except Exception as e:
+            if _is_transient(e):
+                log.warning(f"Job {job_id} could not be read: {e}")
+                return None
+            return str(e)
+        if r.status_code in _GONE_STATUS_CODES:
+            return f"HTTP {r.status_code}"
+        log.warning(f"Job {job_id} could not be read: {r}")
+        return None
+
+    def _fetch_workflow(self, workflow_id: str) -> List[WippJob]:
+        try:
+            return self.client.get_workflow_jobs(workflow_id) or []
+        except Exception as e:
+            log.error(e)
+            return []
+
+    def poll(self, executor: Optional[ThreadPoolExecutor] = None) -> List[WippJob]:
+        """Request every unfinished job once and return those whose status changed"""
+        pending = self.pending
+        run = map if executor is None else executor.map
+
+        workflows = {}
+        for job_id in pending:
+            job = self.jobs[job_id]
+            if job is not None and job.wipp_workflow is not None:
+                workflows.setdefault(job.wipp_workflow, []).append(job_id)
+        workflows = [
+            workflow_id for workflow_id, ids in workflows.items() if len(ids) > 1
+        ]
+        fetched = {}
+        for jobs in run(self._fetch_workflow, workflows):
+            fetched.update({job.id: job for job in jobs})
+        # Jobs missing from the searches (such as deleted ones) are requested too
+        rest = [job_id for job_id in pending if job_id not in fetched]
+        fetched.update(zip(rest, run(self._fetch, rest)))
+
+        changed = []
+        for job_id in pending:
+            job = fetched[job_id]
+            previous = self.jobs[job_id]
+            if job is None:
+                continue
+            if isinstance(job, str):
+                log.error(f"Job {job_id} is unavailable: {job}")
+                job = WippJob(
+                    id=job_id,
+                    name=previous.name if previous is not None else job_id,
+                    status=JOB_UNAVAILABLE,
+                    error=job,
+                )
+            previous_status = previous.status if previous is not None else None
+            self.jobs[job_id] = job
+            if job.status != previous_status:
+                changed.append(job)
+                if self.on_change is not None:
+                    self.on_change(job, previous_status)
+        return changed
+
+    def __iter__(self) -> Iterator[WippJob]:
+        interval = self.interval
+        with _ContextThreadPoolExecutor(max_workers=self.workers) as executor:
+            while self.pending and not self._stopped.is_set():
+                changed = self.poll(executor)
+                yield from changed
+                if not self.pending:
+                    break
+                interval = (
+                    self.interval if changed else min(interval * 2, self.max_interval)
+                )
+                self._stopped.wait(interval)
+
+    def run(self) -> Dict[str, WippJob]:
+        """Poll until all jobs are finished (or stop() is called)
+
+        Returns the latest state of every job
+        """
+        for _ in self:
+            pass
+        return self.jobs
+
+
+class WippPyramidTiles:
+    """Fetch DeepZoom tiles of a WIPP Pyramid with in-memory and on-disk caching
+
+    Tiles are returned as the encoded bytes served by WIPP (such as PNG). They are
+    kept in an LRU cache limited to `cache_bytes` and, if `cache_dir` is set, also
+    stored on disk. Concurrent requests for the same tile share a single fetch.
+    """
+
+    def __init__(
+        self,
+        client: Wipp,
+        pyramid_id: str,
+        timeslice: str = "0",
+        tile_size: int = 256,
+        format: str = "png",
+        cache_bytes: int = 256 * 1024 * 1024,
+        cache_dir: Optional[Union[str, os.PathLike]] = None,
+        workers: int = 8,
+        tile_path: str = "{timeslice}_files/{level}/{x}_{y}.{format}",
+    ):
+        """
+        Keyword arguments:
+        client -- WIPP client used for the requests
+        pyramid_id -- WIPP Pyramid id
+        timeslice -- pyramid timeslice to read tiles from
+        tile_size -- width and height of the tiles in pixels
+        format -- file extension of the tiles
+        cache_bytes -- budget of the in-memory tile cache in bytes
+        cache_dir -- directory of the on-disk tile cache (None disables it)
+        workers -- number of concurrent tile requests
+        tile_path -- tile path below pyramids/<id>/fetching/
+        """
+        self.client = client
+        self.pyramid_id = pyramid_id
+        self.timeslice = timeslice
+        self.tile_size = tile_size
+        self.format = format
+        self.cache = _LRUByteCache(cache_bytes)
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.tile_path = tile_path
+        self._single_flight = _SingleFlight()
+
+    def __str__(self):
+        return f"{self.pyramid_id}\t{self.timeslice}"
+
+    def __repr__(self):
+        return str(self)
+
+    def _relative_path(self, level: int, x: int, y: int) -> str:
+        return self.tile_path.format(
+            timeslice=self.timeslice, level=level, x=x, y=y, format=self.format
+        )
+
+    def _disk_path(self, level: int, x: int, y: int) -> str:
+        return os.path.join(
+            self.cache_dir,
+            self.pyramid_id,
+            self.timeslice,
+            str(level),
+            f"{x}_{y}.{self.format}",
+        )
+
+    def _fetch(self, level: int, x: int, y: int) -> Optional[bytes]:
+        if self.cache_dir is not None:
+            disk_path = self._disk_path(level, x, y)
+            try:
+                with open(disk_path, "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                pass
+
+        r = self.client._request(
+            "GET",
+            self.client.build_request_url(
+                self._relative_path(level, x, y),
+                f"pyramids/{self.pyramid_id}/fetching",
+            ),
+        )
+        if r.status_code != 200:
+            return None
+        tile = r.content
+
+        if self.cache_dir is not None:
+            os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+            # Write next to the final path so readers never see partial tiles
+            tmp_path = f"{disk_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(tile)
+            os.replace(tmp_path, disk_path)
+        return tile
+
+    def tile(self, level: int, x: int, y: int) -> Optional[bytes]:
+        """Get a tile by its pyramid level and column/row, None if it does not exist"""
+        key = (level, x, y)
+        tile = self.cache.get(key)
+        if tile is None:
+            tile = self._single_flight.do(key, self._fetch, level, x, y)
+            if tile is not None:
+                self.cache.put(key, tile)
+        return tile
+
+    def tiles(self, keys: List[Tuple[int, int, int]]) -> Dict[tuple, Optional[bytes]]:
+        """Get many tiles in parallel
+
+        Keyword arguments:
+        keys -- (level, x, y) of the tiles
+        """
+        keys = list(keys)
+        with _ContextThreadPoolExecutor(max_workers=self.workers) as executor:
+            return dict(zip(keys, executor.map(lambda key: self.tile(*key), keys)))
+
+    def region(
+        self, level: int, left: int, top: int, width: int, height: int
+    ) -> Dict[tuple, Optional[bytes]]:
+        """Get all tiles covering a region of a pyramid level
+
+        Keyword arguments:
+        level -- pyramid level
+        left, top -- pixel coordinates of the region at this level
+        width, height -- size of the region in pixels
+        """
+        first_x, last_x = left // self.tile_size, (left + width - 1) // self.tile_size
+        first_y, last_y = top // self.tile_size, (top + height - 1) // self.tile_size
+        return self.tiles(
+            [
+                (level, x, y)
+                for y in range(first_y, last_y + 1)
+                for x in range(first_x, last_x + 1)
+            ]
+        )
+
+
+# Column kinds of a snapshot, by (singleton) field type
+_SNAPSHOT_KINDS = {
+    int: "int",
+    float: "float",
+    bool: "bool",
+    str: "str",
+    datetime: "str",
+}
+_SNAPSHOT_MAGIC = b"WIPPSNAP"
+_SNAPSHOT_VERSION = 1
+
+
+def _snapshot_kind(model: type, alias: str) -> str:
+    for field in model.__fields__.values():
+        if field.alias == alias:
+            if field.shape == SHAPE_SINGLETON:
+                return _SNAPSHOT_KINDS.get(field.type_, "json")
+            break
+    return "json"
+
+
+def _encode_snapshot(entities, model: type) -> bytearray:
+    """Encode entities into the columnar snapshot layout (see WippSnapshot)"""
+    rows = [
+        entity.raw if isinstance(entity, WippLazyEntity) else entity.dict(by_alias=True)
+        for entity in entities
+    ]
+    aliases = {field.alias: None for field in model.__fields__.values()}
+    for row in rows:
+        for alias in row:
+            aliases.setdefault(alias, None)
+
+    data = bytearray()
+
+    def add(buffer) -> List[int]:
+        data.extend(b"\0" * (-len(data) % 8))
+        offset = len(data)
+        data.extend(buffer)
+        return [offset, len(data) - offset]
+
+    columns = []
+    for alias in aliases:
+        values = [row.get(alias) for row in rows]
+        valid = bytes(value is not None for value in values)
+        kind = _snapshot_kind(model, alias)
+        try:
+            if kind == "int":
+                buffers = [add(array("q", [v or 0 for v in values]))]
+            elif kind == "float":
+                buffers = [add(array("d", [v or 0.0 for v in values]))]
+            elif kind == "bool":
+                buffers = [add(bytes(bool(v) for v in values))]
+        except (OverflowError, TypeError):
+            kind = "json"
+        if kind in ("str", "json"):
+            if kind == "str":
+                encoded = [
+                    (
+                        (v.isoformat() if isinstance(v, datetime) else str(v)).encode()
+                        if v is not None
+                        else b""
+                    )
+                    for v in values
+                ]
+            else:
+                encoded = [json.dumps(v, default=str).encode() for v in values]
+            offsets = array("q", [0])
+            for value in encoded:
+                offsets.append(offsets[-1] + len(value))
+            buffers = [add(offsets), add(b"".join(encoded))]
+        buffers.append(add(valid))
+        columns.append({"alias": alias, "kind": kind, "buffers": buffers})
+
+    header = json.dumps(
+        {
+            "version": _SNAPSHOT_VERSION,
+            "model": model.__name__,
+            "length": len(rows),
+            "columns": columns,
+        }
+    ).encode()
+    # Magic, header length and header, padded so column buffers stay aligned
+    prefix = _SNAPSHOT_MAGIC + len(header).to_bytes(8, "little") + header
+    prefix += b"\0" * (-len(prefix) % 8)
+    return bytearray(prefix) + data
+
+
+class WippSnapshot:
+    """Read-only columnar snapshot of a listing of WIPP entities
+
+    The snapshot is a single binary buffer (a file mapped with mmap, or shared
+    memory) with one array per field: int64, float64 and bool values directly,
+    strings and dates as offsets plus UTF-8 data, other values as JSON. Opening
+    it neither copies nor parses the entities, rows are decoded into
+    WippLazyEntity objects only when read, and columns can be read as
+    memoryviews. A snapshot pickles as its path or shared memory name, so it is
+    cheap to send to multiprocessing workers, which open it again.
+
+    Snapshots are created with Wipp.snapshot_entities, WippSnapshot.write or
+    WippSnapshot.to_shared_memory. The creator of a shared memory snapshot
+    must call unlink() when no process needs it anymore.
+    """
+
+    def __init__(self, buffer, path: Optional[str] = None, shm=None):
+        self._buffer = buffer
+        self._shm = shm
+        self._view = memoryview(buffer)
+        self.path = path
+        if bytes(self._view[:8]) != _SNAPSHOT_MAGIC:
+            raise ValueError("Not a WIPP entity snapshot")
+        size = int.from_bytes(self._view[8:16], "little")
+        header = json.loads(bytes(self._view[16 : 16 + size]))
+        if header["version"] != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {header['version']}")
+        data = 16 + size + (-(16 + size) % 8)
+        self.model = _snapshot_models().get(header["model"], WippEntity)
+        self._length = header["length"]
+        self._columns = {}
+        for column in header["columns"]:
+            buffers = [
+                self._view[data + o : data + o + n] for o, n in column["buffers"]
+            ]
+            if column["kind"] == "int":
+                buffers[0] = buffers[0].cast("q")
+            elif column["kind"] == "float":
+                buffers[0] = buffers[0].cast("d")
+            elif column["kind"] in ("str", "json"):
+                buffers[0] = buffers[0].cast("q")
+            self._columns[column["alias"]] = (column["kind"], buffers)
+
+    @classmethod
+    def write(
+        cls, entities, path: Union[str, os.PathLike], model: Optional[type] = None
+    ) -> "WippSnapshot":
+        """Write a snapshot of entities to a file and open it
+
+        Keyword arguments:
+        entities -- WIPP entities (models or WippLazyEntity) of a single type
+        path -- path of the snapshot file
+        model -- entity model (default: the model of the first entity)
+        """
+        entities = list(entities)
+        with open(path, "wb") as f:
+            f.write(_encode_snapshot(entities, model or _snapshot_model(entities)))
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike]) -> "WippSnapshot":
+        """Open a snapshot file, mapping it into memory"""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path=os.fspath(path))
+
+    @classmethod
+    def to_shared_memory(
+        cls, entities, model: Optional[type] = None, name: Optional[str] = None
+    ) -> "WippSnapshot":
+        """Write a snapshot of entities to a new shared memory block
+
+        Keyword arguments:
+        entities -- WIPP entities (models or WippLazyEntity) of a single type
+        model -- entity model (default: the model of the first entity)
+        name -- name of the shared memory block (default: a random name)
+        """
+        entities = list(entities)
+        data = _encode_snapshot(entities, model or _snapshot_model(entities))
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        shm.buf[: len(data)] = data
+        return cls(shm.buf, shm=shm)
+
+    @classmethod
+    def attach(cls, name: str) -> "WippSnapshot":
+        """Open a snapshot in shared memory by its name"""
+        try:
+            # Python 3.13+, the creator owns the block
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(shm.buf, shm=shm)
+
+    @property
+    def name(self) -> Optional[str]:
+        """Name of the shared memory block, None for a file snapshot"""
+        return self._shm.name if self._shm is not None else None
+
+    @property
+    def fields(self) -> List[str]:
+        """Keys of the entities, as in WIPP JSONs"""
+        return list(self._columns)
+
+    def __reduce__(self):
+        if self._shm is not None:
+            return (WippSnapshot.attach, (self._shm.name,))
+        if self.path is None:
+            raise TypeError("Only file or shared memory snapshots can be pickled")
+        return (WippSnapshot.open, (self.path,))
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        source = self.path or self.name
+        return f"{self.model.__name__} snapshot\t{self._length} entities\t{source}"
+
+    def __repr__(self):
+        return str(self)
+
+    def _value(self, kind: str, buffers: list, i: int):
+        if not buffers[-1][i]:
+            return None
+        if kind == "int" or kind == "float":
+            return buffers[0][i]
+        if kind == "bool":
+            return bool(buffers[0][i])
+        offsets, data = buffers[0], buffers[1]
+        value = str(data[offsets[i] : offsets[i + 1]], "utf-8")
+        return value if kind == "str" else json.loads(value)
+
+    def raw(self, i: int) -> dict:
+        """The dict of the i-th entity, as returned by WIPP API"""
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("snapshot index out of range")
+        raw = {}
+        for alias, (kind, buffers) in self._columns.items():
+            value = self._value(kind, buffers, i)
+            if value is not None:
+                raw[alias] = value
+        return raw
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._length))]
+        return WippLazyEntity(self.raw(i), self.model)
+
+    def __iter__(self) -> Iterator[WippLazyEntity]:
+        for i in range(self._length):
+            yield self[i]
+
+    def column(self, field: str) -> Union[memoryview, list]:
+        """Values of a field for all entities
+
+        int and float fields are returned as a memoryview over the snapshot,
+        without copying (missing values read as 0), other fields as a list.
+
+        Keyword arguments:
+        field -- field name (such as "file_size") or its key in WIPP JSONs
+        """
+        alias = _field_aliases(self.model, [field])[0]
+        kind, buffers = self._columns.get(alias) or self._columns[field]
+        if kind == "int" or kind == "float":
+            return buffers[0]
+        return [self._value(kind, buffers, i) for i in range(self._length)]
+
+    def close(self):
+        """Release the snapshot buffer (columns returned before must not be used)"""
+        if self._view is None:
+            return
+        for _, buffers in self._columns.values():
+            for buffer in buffers:
+                buffer.release()
+        self._columns = {}
+        self._view.release()
+        self._view = None
+        if self._shm is not None:
+            self._shm.close()
+        elif isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __del__(self):
+        # Views must be released before the shared memory or mmap is closed
+        try:
+            self.close()
+        except (AttributeError, BufferError):
+            pass
+
+    def unlink(self):
+        """Free the shared memory block, once all processes closed it"""
+        if self._shm is not None:
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _snapshot_models() -> Dict[str, type]:
+    return {model.__name__: model for model in _entity_classes.values()}
+
+
+def _snapshot_model(entities: list) -> type:
+    if not entities:
+        return WippEntity
+    if isinstance(entities[0], WippLazyEntity):
+        return entities[0]._model
+    return type(entities[0])